@@ -0,0 +1,52 @@
+import argparse
+import json
+import sys
+
+from aoc.benchmark import compare, sweep
+from aoc.generators import generate
+from aoc.runner import normalize_day, run
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="aoc")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run and time a single day")
+    run_parser.add_argument("day", help="e.g. day15 or 15")
+    run_parser.add_argument("--part", type=int, choices=(1, 2), default=1)
+    run_parser.add_argument("--input", help="Defaults to the day's own input file")
+
+    generate_parser = subparsers.add_parser("generate", help="Write a synthetic input to stdout")
+    generate_parser.add_argument("day", help="e.g. day15 or 15")
+    generate_parser.add_argument("--size", type=int, required=True)
+    generate_parser.add_argument("--seed", type=int, default=0)
+
+    bench_parser = subparsers.add_parser("bench", help="Time a day over a range of synthetic input sizes")
+    bench_parser.add_argument("day", help="e.g. day15 or 15")
+    bench_parser.add_argument("--part", type=int, choices=(1, 2), default=1)
+    bench_parser.add_argument("--sizes", type=int, nargs="+", required=True)
+    bench_parser.add_argument("--seed", type=int, default=0)
+
+    compare_parser = subparsers.add_parser("compare", help="Time a day's alternative implementations on one synthetic input")
+    compare_parser.add_argument("day", help="e.g. day08 or 8")
+    compare_parser.add_argument("--part", type=int, choices=(1, 2), default=2)
+    compare_parser.add_argument("--size", type=int, required=True)
+    compare_parser.add_argument("--seed", type=int, default=0)
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        report = run(args.day, args.part, args.input)
+    elif args.command == "generate":
+        sys.stdout.write(generate(normalize_day(args.day), args.size, seed=args.seed))
+        return
+    elif args.command == "bench":
+        report = sweep(args.day, args.part, args.sizes, seed=args.seed)
+    elif args.command == "compare":
+        report = compare(args.day, args.part, args.size, seed=args.seed)
+
+    print(json.dumps(report, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
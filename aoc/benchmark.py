@@ -0,0 +1,103 @@
+import sys
+
+from aoc.days import get_solution
+from aoc.generators import generate
+from aoc.runner import ROOT, execute, measure, normalize_day
+
+
+def message_values(messages):
+    return sum(1000 * a + 100 * b + 10 * c + d for a, b, c, d in messages)
+
+
+# Alternative implementations of the same step, run against the same parsed
+# input by compare. Each takes (module, parsed) and returns something the
+# others should agree with.
+VARIANTS = {
+    "day08": {
+        "lookup": lambda m, displays: message_values(d.decode(d.message_encrypted) for d in displays),
+        "masks": lambda m, displays: message_values(d.decode_by_masks(d.message_encrypted) for d in displays),
+        "search": lambda m, displays: message_values(d.decode_by_search(d.message_encrypted) for d in displays),
+    },
+}
+
+# One-off work a variant depends on, timed separately so it isn't charged to
+# whichever variant happens to run first
+SETUP = {
+    "day08": lambda m: m.wiring_index(),
+}
+
+# Parts whose synthetic inputs aren't guaranteed to have an answer, so a
+# sweep could run forever
+UNSWEEPABLE = {
+    ("day11", 2): "random octopus grids may never synchronise",
+}
+
+
+def sweep(day, part, sizes, seed=0):
+    day = normalize_day(day)
+
+    if (day, part) in UNSWEEPABLE:
+        raise Exception("Can't sweep %s part %s: %s" % (day, part, UNSWEEPABLE[(day, part)]))
+
+    results = []
+
+    for size in sizes:
+        content = generate(day, size, seed=seed)
+        report = execute(day, part, content)
+
+        total_time = report["parse"]["wall_time"] + report["solve"]["wall_time"]
+
+        results.append({
+            "size": size,
+            "input_bytes": len(content),
+            "answer": report["answer"],
+            "parse": report["parse"],
+            "solve": report["solve"],
+            "throughput": size / total_time if total_time else None,
+        })
+
+    return {
+        "day": day,
+        "part": part,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def compare(day, part, size, seed=0):
+    day = normalize_day(day)
+
+    if day not in VARIANTS:
+        raise Exception("No variants registered for %s" % day)
+
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+
+    solution = get_solution(day, part)
+    module = solution.module
+    content = generate(day, size, seed=seed)
+    parsed, parse_stats = measure(solution.parse, module, content)
+
+    report = {
+        "day": day,
+        "part": part,
+        "size": size,
+        "seed": seed,
+        "parse": parse_stats,
+    }
+
+    if day in SETUP:
+        _, report["setup"] = measure(SETUP[day], module)
+
+    variants = {}
+
+    for name, fn in VARIANTS[day].items():
+        answer, stats = measure(fn, module, parsed)
+        stats["answer"] = answer
+        stats["throughput"] = size / stats["wall_time"] if stats["wall_time"] else None
+        variants[name] = stats
+
+    report["variants"] = variants
+    report["answers_match"] = len(set(stats["answer"] for stats in variants.values())) == 1
+
+    return report
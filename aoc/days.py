@@ -0,0 +1,371 @@
+import importlib
+import re
+import statistics
+
+
+class Solution:
+    def __init__(self, module_name, parse, solve):
+        self.module_name = module_name
+        self.parse = parse
+        self.solve = solve
+
+    @property
+    def module(self):
+        return importlib.import_module(self.module_name)
+
+
+def count_increases(values):
+    count = 0
+    last_value = None
+
+    for value in values:
+        if last_value is not None and value > last_value:
+            count += 1
+
+        last_value = value
+
+    return count
+
+
+def run_submarine(m, commands):
+    submarine = m.Submarine()
+    submarine.process_commands(commands)
+
+    return submarine.x * submarine.z
+
+
+def population_after(fishpop, num_ticks):
+    fishpop.fast_forward(num_ticks)
+    return fishpop.total
+
+
+def count_easy_digits(displays):
+    return sum(1 for display in displays for num in display.message if num in (1, 4, 7, 8))
+
+
+def largest_basins_product(tube_map):
+    sorted_sizes = sorted(tube_map.basin_sizes, reverse=True)
+    return sorted_sizes[0] * sorted_sizes[1] * sorted_sizes[2]
+
+
+def flashes_after(grid, num_ticks):
+    grid.fast_forward(num_ticks)
+    return grid.total_flashes
+
+
+def first_sync(grid):
+    grid.fast_forward_until_sync()
+    return grid.ticks
+
+
+def fold(grid, times=None):
+    while grid.folds and times != 0:
+        grid = grid.fold()
+
+        if times is not None:
+            times -= 1
+
+    return grid
+
+
+def polymer_spread(polymerizer, num_ticks):
+    polymerizer.fast_forward(num_ticks)
+    return polymerizer.num_most_common - polymerizer.num_least_common
+
+
+def lowest_risk(cave):
+    dist, prev = cave.search()
+    return dist[(cave.width - 1, cave.height - 1)]
+
+
+def highest_trajectory(p):
+    max_vy = max(t[1] for t in p.find_valid_trajectories())
+    return p.calculate_y(max_vy, max_vy)
+
+
+def refine(img, times):
+    for _ in range(times):
+        img.refine()
+
+    return img.num_lit_pixels
+
+
+def practice_game(game):
+    game.play()
+    return game.losers[0].score * game.die.times_rolled
+
+
+def total_lit(reactor):
+    return sum(slice.area for slice in reactor.construct_slices() if slice)
+
+
+BURROW_ROOM_SLOTS = "hijklmnopqrstuvw"
+BURROW_UNFOLDED_ROWS = ("DCBA", "DBAC")
+
+
+def read_burrow(content, unfold=False):
+    rows = [re.findall(r"[ABCD]", line) for line in content.splitlines()]
+    rows = [row for row in rows if row]
+
+    if unfold:
+        rows = rows[:1] + [list(row) for row in BURROW_UNFOLDED_ROWS] + rows[1:]
+
+    amphipods = [a for row in rows for a in row]
+    return dict(zip(BURROW_ROOM_SLOTS, amphipods))
+
+
+def check_model_number(m, program, model_number):
+    alu = m.ALU()
+    alu.run(program, model_number)
+    return alu.z
+
+
+SOLUTIONS = {
+    ("day01", 1): Solution(
+        "day01.solution2",
+        lambda m, content: [int(num) for num in content.splitlines() if num],
+        lambda m, numbers: count_increases(numbers),
+    ),
+    ("day01", 2): Solution(
+        "day01.solution2",
+        lambda m, content: [int(num) for num in content.splitlines() if num],
+        lambda m, numbers: m.count_window_increases_batch(numbers, 3),
+    ),
+    ("day02", 1): Solution(
+        "day02.solution1",
+        lambda m, content: content.splitlines(),
+        run_submarine,
+    ),
+    ("day02", 2): Solution(
+        "day02.solution2",
+        lambda m, content: content.splitlines(),
+        run_submarine,
+    ),
+    ("day03", 1): Solution(
+        "day03.solution1",
+        lambda m, content: m.DiagnosticReport(content),
+        lambda m, report: report.power_consumption,
+    ),
+    ("day03", 2): Solution(
+        "day03.solution2",
+        lambda m, content: m.DiagnosticReport(content),
+        lambda m, report: report.life_support_rating,
+    ),
+    ("day04", 1): Solution(
+        "day04.solution1",
+        lambda m, content: m.read_game(content),
+        lambda m, game: m.vectorized_winners(*game)[0][1],
+    ),
+    ("day04", 2): Solution(
+        "day04.solution2",
+        lambda m, content: m.read_game(content),
+        lambda m, game: m.vectorized_winners(*game)[1][1],
+    ),
+    ("day05", 1): Solution(
+        "day05.solution1",
+        lambda m, content: [m.Line.from_str(line) for line in content.splitlines()],
+        lambda m, lines: m.count_intersections(lines),
+    ),
+    ("day05", 2): Solution(
+        "day05.solution2",
+        lambda m, content: [m.Line.from_str(line) for line in content.splitlines()],
+        lambda m, lines: m.count_intersections(lines),
+    ),
+    ("day06", 1): Solution(
+        "day06.solution1",
+        lambda m, content: m.FishPopulation.from_str(content.strip()),
+        lambda m, fishpop: population_after(fishpop, 80),
+    ),
+    ("day06", 2): Solution(
+        "day06.solution2",
+        lambda m, content: m.FishPopulation.from_str(content.strip()),
+        lambda m, fishpop: population_after(fishpop, 256),
+    ),
+    ("day07", 1): Solution(
+        "day07.solution1",
+        lambda m, content: m.CrabNavy.from_str(content.strip()),
+        lambda m, navy: navy.ideal_alignment_consumption,
+    ),
+    ("day07", 2): Solution(
+        "day07.solution2",
+        lambda m, content: m.CrabNavy.from_str(content.strip()),
+        lambda m, navy: navy.ideal_alignment_consumption,
+    ),
+    ("day08", 1): Solution(
+        "day08.solution1",
+        lambda m, content: [m.Display.from_str(line) for line in content.splitlines()],
+        lambda m, displays: count_easy_digits(displays),
+    ),
+    ("day08", 2): Solution(
+        "day08.solution2",
+        lambda m, content: [m.Display.from_str(line) for line in content.splitlines()],
+        lambda m, displays: sum(display.message_sum for display in displays),
+    ),
+    ("day09", 1): Solution(
+        "day09.solution1",
+        lambda m, content: m.TubeMap.from_raw_lines(content.splitlines()),
+        lambda m, tube_map: tube_map.total_risk_factor,
+    ),
+    ("day09", 2): Solution(
+        "day09.solution2",
+        lambda m, content: m.TubeMap.from_raw_lines(content.splitlines()),
+        lambda m, tube_map: largest_basins_product(tube_map),
+    ),
+    ("day10", 1): Solution(
+        "day10.validator",
+        lambda m, content: content.encode(),
+        lambda m, data: m.validate([data])[0],
+    ),
+    ("day10", 2): Solution(
+        "day10.validator",
+        lambda m, content: content.encode(),
+        lambda m, data: statistics.median(m.validate([data])[1]),
+    ),
+    ("day11", 1): Solution(
+        "day11.solution1",
+        lambda m, content: m.OctoGrid.from_raw_lines(content.splitlines()),
+        lambda m, grid: flashes_after(grid, 100),
+    ),
+    ("day11", 2): Solution(
+        "day11.solution2",
+        lambda m, content: m.OctoGrid.from_raw_lines(content.splitlines()),
+        lambda m, grid: first_sync(grid),
+    ),
+    ("day12", 1): Solution(
+        "day12.solution1",
+        lambda m, content: m.Network.from_raw_lines(content.splitlines()),
+        lambda m, network: network.count_paths(),
+    ),
+    ("day12", 2): Solution(
+        "day12.solution2",
+        lambda m, content: m.Network.from_raw_lines(content.splitlines()),
+        lambda m, network: network.count_paths(),
+    ),
+    ("day13", 1): Solution(
+        "day13.solution1",
+        lambda m, content: m.Grid.from_input(content.splitlines()),
+        lambda m, grid: len(fold(grid, times=1).dots),
+    ),
+    ("day13", 2): Solution(
+        "day13.solution2",
+        lambda m, content: m.Grid.from_input(content.splitlines()),
+        lambda m, grid: str(fold(grid)),
+    ),
+    ("day14", 1): Solution(
+        "day14.solution1",
+        lambda m, content: m.Polymerizer.from_input(content.splitlines()),
+        lambda m, polymerizer: polymer_spread(polymerizer, 10),
+    ),
+    ("day14", 2): Solution(
+        "day14.solution2",
+        lambda m, content: m.Polymerizer.from_input(content.splitlines()),
+        lambda m, polymerizer: polymer_spread(polymerizer, 40),
+    ),
+    ("day15", 1): Solution(
+        "day15.solution1",
+        lambda m, content: m.Cave.from_raw_lines(content.splitlines()),
+        lambda m, cave: lowest_risk(cave),
+    ),
+    ("day15", 2): Solution(
+        "day15.solution2",
+        lambda m, content: m.Cave.from_raw_lines(content.splitlines()),
+        lambda m, cave: cave.search(),
+    ),
+    ("day16", 1): Solution(
+        "day16.solution1",
+        lambda m, content: m.Message(content.strip()),
+        lambda m, message: message.version_sum,
+    ),
+    ("day16", 2): Solution(
+        "day16.solution2",
+        lambda m, content: m.Message(content.strip()),
+        lambda m, message: message.evaluate(),
+    ),
+    ("day17", 1): Solution(
+        "day17.solution1",
+        lambda m, content: m.Problem.from_input(content.strip()),
+        lambda m, p: highest_trajectory(p),
+    ),
+    ("day17", 2): Solution(
+        "day17.solution2",
+        lambda m, content: m.Problem.from_input(content.strip()),
+        lambda m, p: len(p.find_valid_trajectories()),
+    ),
+    ("day18", 1): Solution(
+        "day18.solution1",
+        lambda m, content: m.Assignment.from_input(content.splitlines()),
+        lambda m, a: a.solve().magnitude,
+    ),
+    ("day18", 2): Solution(
+        "day18.solution2",
+        lambda m, content: m.Assignment.from_input(content.splitlines()),
+        lambda m, a: a.solve(),
+    ),
+    ("day19", 1): Solution(
+        "day19.solution1",
+        lambda m, content: m.Problem.from_input(content.strip().splitlines()),
+        lambda m, problem: len(problem.solve()),
+    ),
+    ("day19", 2): Solution(
+        "day19.solution2",
+        lambda m, content: m.Problem.from_input(content.strip().splitlines()),
+        lambda m, problem: problem.solve(),
+    ),
+    ("day20", 1): Solution(
+        "day20.solution1",
+        lambda m, content: m.Image.from_input(content.strip().splitlines()),
+        lambda m, img: refine(img, 2),
+    ),
+    ("day20", 2): Solution(
+        "day20.solution2",
+        lambda m, content: m.Image.from_input(content.strip().splitlines()),
+        lambda m, img: refine(img, 50),
+    ),
+    ("day21", 1): Solution(
+        "day21.solution1",
+        lambda m, content: m.Game.from_input(content.splitlines()),
+        lambda m, game: practice_game(game),
+    ),
+    ("day21", 2): Solution(
+        "day21.solution2",
+        lambda m, content: m.Game.from_input(content.splitlines()),
+        lambda m, game: max(game.play()),
+    ),
+    ("day22", 1): Solution(
+        "day22.solution1",
+        lambda m, content: m.Reactor.from_input(content.splitlines()[:20]),
+        lambda m, reactor: total_lit(reactor),
+    ),
+    ("day22", 2): Solution(
+        "day22.solution2",
+        lambda m, content: m.Reactor.from_input(content.splitlines()),
+        lambda m, reactor: total_lit(reactor),
+    ),
+    ("day23", 1): Solution(
+        "day23.solution1",
+        lambda m, content: m.Burrow(read_burrow(content)),
+        lambda m, burrow: burrow.find_best_solution(),
+    ),
+    ("day23", 2): Solution(
+        "day23.solution2",
+        lambda m, content: m.Burrow(read_burrow(content, unfold=True)),
+        lambda m, burrow: burrow.find_best_solution(),
+    ),
+    ("day24", 1): Solution(
+        "day24.solution_verification",
+        lambda m, content: m.ALU().compile(content.splitlines()),
+        lambda m, program: check_model_number(m, program, m.LARGEST_INPUT),
+    ),
+    ("day24", 2): Solution(
+        "day24.solution_verification",
+        lambda m, content: m.ALU().compile(content.splitlines()),
+        lambda m, program: check_model_number(m, program, m.SMALLEST_INPUT),
+    ),
+}
+
+
+def get_solution(day, part):
+    try:
+        return SOLUTIONS[(day, part)]
+    except KeyError:
+        raise Exception("No solution registered for %s part %s" % (day, part))
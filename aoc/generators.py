@@ -0,0 +1,521 @@
+import itertools
+import random
+
+
+def generate_depths(size, rng):
+    depth = rng.randint(100, 200)
+    depths = []
+
+    for _ in range(size):
+        depth = max(0, depth + rng.randint(-10, 20))
+        depths.append(depth)
+
+    return "\n".join(map(str, depths)) + "\n"
+
+
+def generate_commands(size, rng):
+    commands = []
+
+    for _ in range(size):
+        command = rng.choice(("forward", "down", "up"))
+        commands.append(f"{command} {rng.randint(1, 9)}")
+
+    return "\n".join(commands) + "\n"
+
+
+def generate_diagnostic_report(size, rng, width=12):
+    # Readings are distinct, and the CO2 search must never be left with
+    # several readings that all agree on the bit it filters by, or it would
+    # filter them all out. The oxygen search keeps the most common bit, so
+    # it can't run dry.
+    width = max(width, (size - 1).bit_length())
+    readings = rng.sample(range(1 << width), size)
+
+    while True:
+        survivors = list(range(len(readings)))
+
+        for idx in range(width):
+            if len(survivors) == 1:
+                break
+
+            bit = 1 << (width - 1 - idx)
+            ones = [i for i in survivors if readings[i] & bit]
+            zeroes = [i for i in survivors if not readings[i] & bit]
+
+            if not ones or not zeroes:
+                break
+
+            survivors = zeroes if len(ones) >= len(zeroes) else ones
+        else:
+            break
+
+        if len(survivors) == 1:
+            break
+
+        # Flipping the bit on one survivor gives both values at this step
+        # without touching any earlier one. Nothing else shares that
+        # survivor's earlier bits with the other value, so it stays distinct.
+        readings[rng.choice(survivors)] ^= bit
+
+    return "\n".join(format(reading, "0%db" % width) for reading in readings) + "\n"
+
+
+def generate_bingo(size, rng):
+    numbers = list(range(100))
+    rng.shuffle(numbers)
+
+    output = ",".join(map(str, numbers)) + "\n"
+
+    for _ in range(size):
+        values = rng.sample(range(100), 25)
+        output += "\n"
+
+        for y in range(5):
+            output += " ".join("%2d" % v for v in values[y * 5: y * 5 + 5]) + "\n"
+
+    return output + "\n"
+
+
+def generate_vents(size, rng, extent=1000):
+    lines = []
+
+    for _ in range(size):
+        x0 = rng.randrange(extent)
+        y0 = rng.randrange(extent)
+        orientation = rng.choice(("horizontal", "vertical", "diagonal"))
+
+        if orientation == "horizontal":
+            x1, y1 = rng.randrange(extent), y0
+        elif orientation == "vertical":
+            x1, y1 = x0, rng.randrange(extent)
+        else:
+            length = rng.randrange(extent)
+            x1 = x0 + rng.choice((-1, 1)) * length
+            y1 = y0 + rng.choice((-1, 1)) * length
+
+            if not (0 <= x1 < extent and 0 <= y1 < extent):
+                x1, y1 = x0, y0
+
+        lines.append(f"{x0},{y0} -> {x1},{y1}")
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_fish(size, rng):
+    return ",".join(str(rng.randint(1, 5)) for _ in range(size)) + "\n"
+
+
+def generate_crabs(size, rng):
+    return ",".join(str(rng.randrange(size)) for _ in range(size)) + "\n"
+
+
+DIGIT_SEGMENTS = (
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+)
+
+
+def generate_displays(size, rng):
+    lines = []
+
+    for _ in range(size):
+        wires = list("abcdefg")
+        rng.shuffle(wires)
+        wiring = dict(zip("abcdefg", wires))
+
+        patterns = ["".join(wiring[s] for s in segments) for segments in DIGIT_SEGMENTS]
+        patterns = ["".join(rng.sample(p, len(p))) for p in patterns]
+        outputs = [rng.choice(patterns) for _ in range(4)]
+        rng.shuffle(patterns)
+
+        lines.append(" ".join(patterns) + " | " + " ".join(outputs))
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_digit_grid(size, rng, low=0, high=9):
+    rows = []
+
+    for _ in range(size):
+        rows.append("".join(str(rng.randint(low, high)) for _ in range(size)))
+
+    return "\n".join(rows) + "\n"
+
+
+def generate_heightmap(size, rng):
+    rows = []
+
+    # Mostly-solid walls of 9s every few cells so the map splits into many basins
+    for y in range(size):
+        row = []
+
+        for x in range(size):
+            on_wall = (x % 5 == 2 or y % 5 == 2) and rng.random() < 0.95
+            row.append("9" if on_wall or rng.random() < 0.05 else str(rng.randint(0, 8)))
+
+        rows.append("".join(row))
+
+    return "\n".join(rows) + "\n"
+
+
+BRACKETS = (("(", ")"), ("[", "]"), ("{", "}"), ("<", ">"))
+
+
+def generate_chunks(size, rng, length=100):
+    lines = []
+
+    for _ in range(size):
+        stack = []
+        line = []
+
+        for _ in range(length):
+            if stack and rng.random() < 0.45:
+                line.append(stack.pop())
+            else:
+                start, end = rng.choice(BRACKETS)
+                stack.append(end)
+                line.append(start)
+
+        # Roughly half the lines get a mismatched closer somewhere near the end
+        if stack and rng.random() < 0.5:
+            wrong = [end for _, end in BRACKETS if end != stack[-1]]
+            line.append(rng.choice(wrong))
+
+        lines.append("".join(line))
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_octopuses(size, rng):
+    # Random grids may never synchronise, so sweep refuses part 2
+    return generate_digit_grid(size, rng)
+
+
+def cave_name(idx):
+    # Cave names may only contain letters
+    name = ""
+
+    while True:
+        name = "abcdefghijklmnopqrstuvwxyz"[idx % 26] + name
+        idx = idx // 26
+        if not idx:
+            return name
+
+
+def generate_caves(size, rng, cluster_size=4):
+    # The small caves are split into clusters around one big cave each, and
+    # clusters are only joined through start and end. Every path stays inside
+    # one cluster, so the answer grows with the number of clusters instead of
+    # exponentially with the number of caves.
+    edges = set()
+
+    for first in range(0, size, cluster_size):
+        small = ["x" + cave_name(i) for i in range(first, min(first + cluster_size, size))]
+        big = "X" + cave_name(first // cluster_size).upper()
+        caves = small + [big]
+
+        for cave in small:
+            edges.add(tuple(sorted((cave, big))))
+
+            other = rng.choice(small)
+            if other != cave:
+                edges.add(tuple(sorted((cave, other))))
+
+        for cave in rng.sample(caves, min(2, len(caves))):
+            edges.add(("start", cave))
+
+        for cave in rng.sample(caves, min(2, len(caves))):
+            edges.add((cave, "end"))
+
+    return "\n".join(f"{n1}-{n2}" for n1, n2 in sorted(edges)) + "\n"
+
+
+def generate_origami(size, rng, num_folds=6):
+    width = height = 2 ** (num_folds // 2 + 1) * 5 - 1
+
+    while width * height < 2 * size:
+        num_folds += 2
+        width = height = 2 * width + 1
+
+    dots = set()
+    while len(dots) < size:
+        dots.add((rng.randrange(width), rng.randrange(height)))
+
+    folds = []
+    fold_width, fold_height = width, height
+
+    for idx in range(num_folds):
+        if idx % 2 == 0:
+            fold_width = fold_width // 2
+            folds.append(f"fold along x={fold_width}")
+        else:
+            fold_height = fold_height // 2
+            folds.append(f"fold along y={fold_height}")
+
+    output = "\n".join(f"{x},{y}" for x, y in sorted(dots))
+    return output + "\n\n" + "\n".join(folds) + "\n"
+
+
+def generate_polymer(size, rng, alphabet="BCFHKNOPSV"):
+    template = "".join(rng.choice(alphabet) for _ in range(size))
+    rules = [f"{a}{b} -> {rng.choice(alphabet)}" for a, b in itertools.product(alphabet, repeat=2)]
+
+    return template + "\n\n" + "\n".join(rules) + "\n"
+
+
+def generate_risk_grid(size, rng):
+    return generate_digit_grid(size, rng, low=1)
+
+
+def encode_packet(rng, budget):
+    version = rng.randrange(8)
+
+    if budget <= 1:
+        value = rng.randrange(1, 2 ** 16)
+        groups = []
+
+        while True:
+            groups.insert(0, value & 0xF)
+            value >>= 4
+            if not value:
+                break
+
+        bits = "".join(("1" if idx < len(groups) - 1 else "0") + format(g, "04b") for idx, g in enumerate(groups))
+        return format(version, "03b") + format(4, "03b") + bits
+
+    packet_type = rng.choice((0, 1, 2, 3, 5, 6, 7))
+    num_subpackets = 2 if packet_type >= 5 else rng.randint(1, 4)
+    child_budget = max(1, (budget - 1) // num_subpackets)
+    subpackets = "".join(encode_packet(rng, child_budget) for _ in range(num_subpackets))
+
+    if rng.random() < 0.5 and len(subpackets) < 2 ** 15:
+        length = "0" + format(len(subpackets), "015b")
+    else:
+        length = "1" + format(num_subpackets, "011b")
+
+    return format(version, "03b") + format(packet_type, "03b") + length + subpackets
+
+
+def generate_transmission(size, rng):
+    bits = encode_packet(rng, size)
+    bits += "0" * (-len(bits) % 8)
+
+    return "%0*X" % (len(bits) // 4, int(bits, 2)) + "\n"
+
+
+def generate_target(size, rng):
+    x0 = rng.randint(size, 2 * size)
+    y1 = -rng.randint(size // 2 + 1, size)
+
+    return f"target area: x={x0}..{x0 + size // 3 + 1}, y={y1 - size // 3 - 1}..{y1}\n"
+
+
+def generate_snailfish_number(rng, depth=0):
+    if depth == 4 or (depth > 0 and rng.random() < 0.3):
+        return str(rng.randint(0, 9))
+
+    a = generate_snailfish_number(rng, depth + 1)
+    b = generate_snailfish_number(rng, depth + 1)
+    return f"[{a},{b}]"
+
+
+def generate_snailfish(size, rng):
+    numbers = []
+
+    while len(numbers) < size:
+        number = generate_snailfish_number(rng)
+        if number.startswith("["):
+            numbers.append(number)
+
+    return "\n".join(numbers) + "\n"
+
+
+def proper_rotations():
+    rotations = []
+
+    for perm in itertools.permutations(range(3)):
+        inversions = sum(1 for i in range(3) for j in range(i + 1, 3) if perm[i] > perm[j])
+
+        for signs in itertools.product((1, -1), repeat=3):
+            if (-1) ** inversions * signs[0] * signs[1] * signs[2] == 1:
+                rotations.append((perm, signs))
+
+    return rotations
+
+
+def rotate(point, rotation):
+    perm, signs = rotation
+    return tuple(point[perm[i]] * signs[i] for i in range(3))
+
+
+def generate_scanners(size, rng, scanner_range=1000):
+    locations = [(0, 0, 0)]
+    beacons = set()
+
+    def random_beacon(bounds):
+        return tuple(rng.randint(lo, hi) for lo, hi in bounds)
+
+    def cube(location):
+        return [(c - scanner_range, c + scanner_range) for c in location]
+
+    for _ in range(14):
+        beacons.add(random_beacon(cube(locations[0])))
+
+    for _ in range(size - 1):
+        previous = rng.choice(locations)
+        location = tuple(c + rng.choice((-1, 1)) * rng.randint(400, 1200) for c in previous)
+
+        # Guarantee at least twelve beacons are visible from both scanners
+        overlap = [(max(a[0], b[0]), min(a[1], b[1])) for a, b in zip(cube(previous), cube(location))]
+        shared = set()
+        while len(shared) < 12:
+            shared.add(random_beacon(overlap))
+
+        beacons |= shared
+        for _ in range(14):
+            beacons.add(random_beacon(cube(location)))
+
+        locations.append(location)
+
+    rotations = proper_rotations()
+    output = []
+
+    for scanner_id, location in enumerate(locations):
+        rotation = rotations[0] if scanner_id == 0 else rng.choice(rotations)
+        output.append(f"--- scanner {scanner_id} ---")
+
+        for beacon in sorted(beacons):
+            relative = tuple(b - l for b, l in zip(beacon, location))
+            if all(abs(c) <= scanner_range for c in relative):
+                output.append(",".join(map(str, rotate(relative, rotation))))
+
+        output.append("")
+
+    return "\n".join(output)
+
+
+def generate_image(size, rng):
+    algorithm = [rng.choice("#.") for _ in range(512)]
+
+    # A lit background must go dark again, otherwise the lit pixel count is infinite
+    if algorithm[0] == "#":
+        algorithm[511] = "."
+
+    rows = ["".join(rng.choice("#.") for _ in range(size)) for _ in range(size)]
+
+    return "".join(algorithm) + "\n\n" + "\n".join(rows) + "\n"
+
+
+def generate_dirac_dice(size, rng):
+    # Fixed-size puzzle, size is ignored
+    return "\n".join(f"Player {p} starting position: {rng.randint(1, 9)}" for p in (1, 2)) + "\n"
+
+
+def generate_reboot_steps(size, rng):
+    lines = []
+
+    for idx in range(size):
+        extent = 50 if idx < 20 else 100000
+        command = "on" if idx < 2 or rng.random() < 0.6 else "off"
+
+        ranges = []
+        for _ in range(3):
+            start = rng.randint(-extent, extent - 1)
+            end = rng.randint(start, min(extent, start + extent // 2 + 1))
+            ranges.append((start, end))
+
+        (x0, x1), (y0, y1), (z0, z1) = ranges
+        lines.append(f"{command} x={x0}..{x1},y={y0}..{y1},z={z0}..{z1}")
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_burrow(size, rng):
+    # Fixed-size puzzle, size is ignored
+    amphipods = list("AABBCCDD")
+    rng.shuffle(amphipods)
+
+    top = "#".join(amphipods[:4])
+    bottom = "#".join(amphipods[4:])
+
+    return f"#############\n#...........#\n###{top}###\n  #{bottom}#\n  #########\n"
+
+
+ALU_BLOCK = """inp w
+mul x 0
+add x z
+mod x 26
+div z {divisor}
+add x {check}
+eql x w
+eql x 0
+mul y 0
+add y 25
+mul y x
+add y 1
+mul z y
+mul y 0
+add y w
+add y {offset}
+mul y x
+add z y"""
+
+
+def generate_monad(size, rng):
+    # Fixed-size puzzle (fourteen digit model numbers), size is ignored
+    blocks = []
+
+    for idx in range(14):
+        push = idx < 7 or rng.random() < 0.5
+        blocks.append(ALU_BLOCK.format(
+            divisor=1 if push else 26,
+            check=rng.randint(10, 15) if push else -rng.randint(0, 15),
+            offset=rng.randint(1, 16),
+        ))
+
+    return "\n".join(blocks) + "\n"
+
+
+GENERATORS = {
+    "day01": generate_depths,
+    "day02": generate_commands,
+    "day03": generate_diagnostic_report,
+    "day04": generate_bingo,
+    "day05": generate_vents,
+    "day06": generate_fish,
+    "day07": generate_crabs,
+    "day08": generate_displays,
+    "day09": generate_heightmap,
+    "day10": generate_chunks,
+    "day11": generate_octopuses,
+    "day12": generate_caves,
+    "day13": generate_origami,
+    "day14": generate_polymer,
+    "day15": generate_risk_grid,
+    "day16": generate_transmission,
+    "day17": generate_target,
+    "day18": generate_snailfish,
+    "day19": generate_scanners,
+    "day20": generate_image,
+    "day21": generate_dirac_dice,
+    "day22": generate_reboot_steps,
+    "day23": generate_burrow,
+    "day24": generate_monad,
+}
+
+
+def generate(day, size, seed=0):
+    try:
+        generator = GENERATORS[day]
+    except KeyError:
+        raise Exception("No generator registered for %s" % day)
+
+    return generator(size, random.Random(seed))
@@ -0,0 +1,96 @@
+import contextlib
+import os
+import sys
+import time
+
+from aoc.days import get_solution
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def normalize_day(day):
+    day = str(day)
+
+    if day.startswith("day"):
+        day = day[3:]
+
+    return "day%02d" % int(day)
+
+
+def reset_peak_rss():
+    # On Linux, writing 5 to clear_refs resets VmHWM to the current resident
+    # size, so what it reports next is the peak since this call rather than
+    # since the process started. Elsewhere there's no way to reset it.
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        return False
+
+    return True
+
+
+def peak_rss_since_reset_kb():
+    with open("/proc/self/status", "r") as f:
+        for line in f:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1])
+
+    return None
+
+
+def measure(fn, *args):
+    peak_tracked = reset_peak_rss()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+
+    # The solutions print progress as they go, keep stdout clean for the report
+    with contextlib.redirect_stdout(sys.stderr):
+        result = fn(*args)
+
+    stats = {
+        "wall_time": time.perf_counter() - wall_start,
+        "cpu_time": time.process_time() - cpu_start,
+        # Highest resident set size while fn ran, including whatever was
+        # already resident when it started. None where it can't be reset.
+        "phase_peak_rss_kb": peak_rss_since_reset_kb() if peak_tracked else None,
+    }
+
+    return result, stats
+
+
+def execute(day, part, content):
+    day = normalize_day(day)
+    solution = get_solution(day, part)
+
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+
+    module = solution.module
+
+    parsed, parse_stats = measure(solution.parse, module, content)
+    answer, solve_stats = measure(solution.solve, module, parsed)
+
+    return {
+        "day": day,
+        "part": part,
+        "answer": answer,
+        "parse": parse_stats,
+        "solve": solve_stats,
+    }
+
+
+def run(day, part, input_path=None):
+    day = normalize_day(day)
+
+    if input_path is None:
+        input_path = os.path.join(ROOT, day, "input")
+
+    with open(input_path, "r") as f:
+        content = f.read()
+
+    report = execute(day, part, content)
+    report["input"] = input_path
+
+    return report
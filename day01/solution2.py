@@ -1,25 +1,62 @@
+from collections import deque
+
+import numpy as np
+
+
 def main():
     with open("input", "r") as f:
-        numbers_raw = f.read()
+        print(count_window_increases(iter_depths(f), 3))
+
+
+def iter_depths(lines):
+    # Works on any iterable of lines, including an open file, one at a time
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield int(line)
+
+
+def iter_window_sums(depths, window_size):
+    if window_size < 1:
+        raise Exception("Invalid window size %s" % window_size)
 
-    numbers = [int(num) for num in numbers_raw.splitlines() if num]
+    window = deque()
+    window_sum = 0
 
+    for depth in depths:
+        window.append(depth)
+        window_sum += depth
+
+        if len(window) > window_size:
+            window_sum -= window.popleft()
+
+        if len(window) == window_size:
+            yield window_sum
+
+
+def count_window_increases(depths, window_size):
     last_sum = None
     count = 0
 
-    for window in iter_window(numbers, 3):
-        this_sum = sum(window)
+    for this_sum in iter_window_sums(depths, window_size):
         if last_sum is not None and this_sum > last_sum:
             count += 1
 
         last_sum = this_sum
 
-    print(count)
+    return count
+
+
+def count_window_increases_batch(depths, window_size):
+    # Same count for depths already in memory, with every window sum taken
+    # from one cumulative sum
+    if window_size < 1:
+        raise Exception("Invalid window size %s" % window_size)
 
+    totals = np.concatenate(([0], np.cumsum(np.asarray(depths, dtype=np.int64))))
+    sums = totals[window_size:] - totals[:-window_size]
 
-def iter_window(sequence, window_size):
-    for i in range(len(sequence) - window_size + 1):
-        yield sequence[i: i + window_size]
+    return int(np.count_nonzero(np.diff(sums) > 0))
 
 
 if __name__ == "__main__":
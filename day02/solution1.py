@@ -1,4 +1,44 @@
+import os
 import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+
+FORWARD = 0
+BACKWARD = 1
+UP = 2
+DOWN = 3
+
+OPCODES = {"forward": FORWARD, "backward": BACKWARD, "up": UP, "down": DOWN}
+
+INT64_LIMIT = 2 ** 63
+
+
+def parse_commands(command_strs):
+    # One pass over the log into opcode and distance arrays, using a table
+    # lookup instead of a regex per command
+    opcodes = []
+    distances = []
+
+    for command_str in command_strs:
+        command, _, distance = command_str.partition(" ")
+        distance = distance.rstrip()
+
+        if command not in OPCODES or not distance.isdigit():
+            raise Exception("Invalid command: %s" % command_str)
+
+        opcodes.append(OPCODES[command])
+        distances.append(int(distance))
+
+    # int64 sums wrap around silently, so logs that could get that far are
+    # kept as Python ints
+    dtype = np.int64 if sum(distances) < INT64_LIMIT else object
+
+    return np.array(opcodes, dtype=np.int8), np.array(distances, dtype=dtype)
+
 
 class Submarine:
     def __init__(self):
@@ -36,14 +76,103 @@ class Submarine:
         elif command == "down":
             self.move_down(distance)
 
+    def process_commands(self, command_strs):
+        opcodes, distances = parse_commands(command_strs)
+
+        def total(opcode):
+            return int(distances[opcodes == opcode].sum())
+
+        self.move_forward(total(FORWARD))
+        self.move_backward(total(BACKWARD))
+        self.move_up(total(UP))
+        self.move_down(total(DOWN))
+
+
+def evaluate_log(path):
+    start = time.perf_counter()
+
+    with open(path, "r") as f:
+        commands = f.read().splitlines()
+
+    submarine = Submarine()
+    submarine.process_commands(commands)
+
+    return {
+        "log": path,
+        "commands": len(commands),
+        "x": submarine.x,
+        "z": submarine.z,
+        "result": submarine.x * submarine.z,
+        "wall_time": time.perf_counter() - start,
+    }
+
+
+class Fleet:
+    def __init__(self, logs):
+        self.logs = logs
+
+    @classmethod
+    def from_paths(cls, paths):
+        # Directories contribute every file directly inside them
+        logs = []
+
+        for path in paths:
+            if os.path.isdir(path):
+                logs.extend(sorted(
+                    os.path.join(path, name)
+                    for name in os.listdir(path)
+                    if os.path.isfile(os.path.join(path, name))
+                ))
+            else:
+                logs.append(path)
+
+        return cls(logs)
+
+    def iter_results(self, processes=None):
+        # Yields each log's result as soon as its worker finishes
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [pool.submit(evaluate_log, log) for log in self.logs]
+
+            for future in as_completed(futures):
+                yield future.result()
+
+    def evaluate(self, processes=None):
+        start = time.perf_counter()
+        results = list(self.iter_results(processes))
+        wall_time = time.perf_counter() - start
+
+        total_commands = sum(result["commands"] for result in results)
+
+        return {
+            "logs": results,
+            "commands": total_commands,
+            "wall_time": wall_time,
+            "commands_per_second": total_commands / wall_time if wall_time else 0,
+        }
+
+
 def main():
+    # Any logs or directories of logs given on the command line are run as a
+    # fleet, otherwise the puzzle input is
+    if len(sys.argv) > 1:
+        fleet = Fleet.from_paths(sys.argv[1:])
+        start = time.perf_counter()
+        total_commands = 0
+
+        for result in fleet.iter_results():
+            total_commands += result["commands"]
+            print(f"{result['log']}: {result['result']} ({result['commands']} commands in {result['wall_time']:.3f}s)")
+
+        wall_time = time.perf_counter() - start
+        print(f"{total_commands} commands in {wall_time:.3f}s ({total_commands / wall_time:.0f} commands/s)")
+
+        return
+
     with open("input", "r") as f:
         commands = f.read().splitlines()
 
     submarine = Submarine()
-
-    for command in commands:
-        submarine.process_command(command)
+    submarine.process_commands(commands)
 
     print(submarine.x * submarine.z)
 
@@ -1,12 +1,56 @@
+import os
 import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+
+FORWARD = 0
+UP = 1
+DOWN = 2
+
+OPCODES = {"forward": FORWARD, "up": UP, "down": DOWN}
+
+INT64_LIMIT = 2 ** 63
+
+
+def parse_commands(command_strs):
+    # One pass over the log into opcode and distance arrays, using a table
+    # lookup instead of a regex per command
+    opcodes = []
+    distances = []
+
+    for command_str in command_strs:
+        command, _, distance = command_str.partition(" ")
+        distance = distance.rstrip()
+
+        if command not in OPCODES or not distance.isdigit():
+            raise Exception("Invalid command: %s" % command_str)
+
+        opcodes.append(OPCODES[command])
+        distances.append(int(distance))
+
+    # int64 sums wrap around silently, so logs that could get that far are
+    # kept as Python ints
+    dtype = np.int64 if sum(distances) < INT64_LIMIT else object
+
+    return np.array(opcodes, dtype=np.int8), np.array(distances, dtype=dtype)
+
 
 class Submarine:
-    def __init__(self):
+    def __init__(self, trace=False):
         self.x = 0
         self.y = 0
         self.z = 0
         self.aim = 0
 
+        # Trace lines are only kept when asked for, and written out in one go
+        # by flush_trace
+        self.trace = trace
+        self.trace_lines = []
+
     def move_forward(self, distance):
         self.x = self.x + distance
         self.z = self.z + self.aim * distance
@@ -37,16 +81,126 @@ class Submarine:
         elif command == "down":
             self.aim_down(distance)
 
-        print(f"{command_str}: {old_x},{old_z} ({old_aim}) -> {self.x},{self.z} ({self.aim})")
+        if self.trace:
+            self.trace_lines.append(f"{command_str}: {old_x},{old_z} ({old_aim}) -> {self.x},{self.z} ({self.aim})")
+
+    def process_commands(self, command_strs):
+        if self.trace:
+            for command_str in command_strs:
+                self.process_command(command_str)
+            return
+
+        opcodes, distances = parse_commands(command_strs)
+        if not len(opcodes):
+            return
+
+        # Every aim is within the starting aim plus all the distances, and z
+        # grows by at most that much per unit moved forward
+        total = int(distances.sum())
+        if (abs(self.aim) + total) * total >= INT64_LIMIT:
+            distances = distances.astype(object)
+
+        # Aim after every command; forward commands don't change it, so this
+        # is also the aim each forward move uses
+        aim_changes = np.where(opcodes == UP, -distances, np.where(opcodes == DOWN, distances, 0))
+        aims = self.aim + np.cumsum(aim_changes)
+
+        forward = opcodes == FORWARD
+        self.x += int(distances[forward].sum())
+        self.z += int((aims[forward] * distances[forward]).sum())
+        self.aim = int(aims[-1])
+
+    def flush_trace(self, stream=sys.stdout):
+        if self.trace_lines:
+            stream.write("\n".join(self.trace_lines) + "\n")
+            self.trace_lines = []
+
+
+def evaluate_log(path):
+    start = time.perf_counter()
+
+    with open(path, "r") as f:
+        commands = f.read().splitlines()
+
+    submarine = Submarine()
+    submarine.process_commands(commands)
+
+    return {
+        "log": path,
+        "commands": len(commands),
+        "x": submarine.x,
+        "z": submarine.z,
+        "result": submarine.x * submarine.z,
+        "wall_time": time.perf_counter() - start,
+    }
+
+
+class Fleet:
+    def __init__(self, logs):
+        self.logs = logs
+
+    @classmethod
+    def from_paths(cls, paths):
+        # Directories contribute every file directly inside them
+        logs = []
+
+        for path in paths:
+            if os.path.isdir(path):
+                logs.extend(sorted(
+                    os.path.join(path, name)
+                    for name in os.listdir(path)
+                    if os.path.isfile(os.path.join(path, name))
+                ))
+            else:
+                logs.append(path)
+
+        return cls(logs)
+
+    def iter_results(self, processes=None):
+        # Yields each log's result as soon as its worker finishes
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [pool.submit(evaluate_log, log) for log in self.logs]
+
+            for future in as_completed(futures):
+                yield future.result()
+
+    def evaluate(self, processes=None):
+        start = time.perf_counter()
+        results = list(self.iter_results(processes))
+        wall_time = time.perf_counter() - start
+
+        total_commands = sum(result["commands"] for result in results)
+
+        return {
+            "logs": results,
+            "commands": total_commands,
+            "wall_time": wall_time,
+            "commands_per_second": total_commands / wall_time if wall_time else 0,
+        }
+
 
 def main():
+    # Any logs or directories of logs given on the command line are run as a
+    # fleet, otherwise the puzzle input is
+    if len(sys.argv) > 1:
+        fleet = Fleet.from_paths(sys.argv[1:])
+        start = time.perf_counter()
+        total_commands = 0
+
+        for result in fleet.iter_results():
+            total_commands += result["commands"]
+            print(f"{result['log']}: {result['result']} ({result['commands']} commands in {result['wall_time']:.3f}s)")
+
+        wall_time = time.perf_counter() - start
+        print(f"{total_commands} commands in {wall_time:.3f}s ({total_commands / wall_time:.0f} commands/s)")
+
+        return
+
     with open("input", "r") as f:
         commands = f.read().splitlines()
 
     submarine = Submarine()
-
-    for command in commands:
-        submarine.process_command(command)
+    submarine.process_commands(commands)
 
     print(submarine.x)
     print(submarine.z)
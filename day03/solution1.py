@@ -1,26 +1,32 @@
-import statistics
+import numpy as np
 
 
 class DiagnosticReport:
     def __init__(self, report_content):
         self.report_content = report_content
-        self.rows = self.parse_report_content()
-        self.cols = list(map(list, zip(*self.rows)))
-        self.width = len(self.rows[0])
-        self.height = len(self.cols[0])
+        self.bits = self.parse_report_content()
+        self.height, self.width = self.bits.shape
 
     def parse_report_content(self):
-        rows = []
-        lines = [l.strip() for l in self.report_content.splitlines()]
+        # One uint8 per bit, read straight out of the text rather than going
+        # through a Python int per character
+        lines = self.report_content.split()
+        raw = np.frombuffer("".join(lines).encode("ascii"), dtype=np.uint8)
 
-        for line in lines:
-            rows.append([int(c) for c in line])
+        return (raw - ord("0")).reshape(len(lines), len(lines[0]))
 
-        return rows
+    def row_value(self, row):
+        return int("".join(map(str, self.bits[row])), 2)
+
+    @property
+    def column_counts(self):
+        return self.bits.sum(axis=0, dtype=np.int64)
 
     @property
     def column_modes(self):
-        return [statistics.mode(col) for col in self.cols]
+        # Ties go to whichever value comes first, as statistics.mode does
+        ones = 2 * self.column_counts
+        return np.where(ones > self.height, 1, np.where(ones < self.height, 0, self.bits[0])).tolist()
 
     @property
     def gamma_rate(self):
@@ -1,35 +1,47 @@
-import statistics
+import numpy as np
 
 
 class DiagnosticReport:
     def __init__(self, report_content):
         self.report_content = report_content
-        self.rows = self.parse_report_content()
-        self.cols = list(map(list, zip(*self.rows)))
-        self.width = len(self.rows[0])
-        self.height = len(self.cols[0])
+        self.bits = self.parse_report_content()
+        self.height, self.width = self.bits.shape
+        self._sorted_values = None
 
     def parse_report_content(self):
-        rows = []
-        lines = [l.strip() for l in self.report_content.splitlines()]
+        # One uint8 per bit, read straight out of the text rather than going
+        # through a Python int per character
+        lines = self.report_content.split()
+        raw = np.frombuffer("".join(lines).encode("ascii"), dtype=np.uint8)
 
-        for line in lines:
-            rows.append([int(c) for c in line])
+        return (raw - ord("0")).reshape(len(lines), len(lines[0]))
 
-        return rows
+    def row_value(self, row):
+        return int("".join(map(str, self.bits[row])), 2)
 
-    def rows_to_columns(self, rows):
-        return list(map(list, zip(*rows)))
+    @property
+    def sorted_values(self):
+        # Every reading as an integer, sorted once and kept, so readings
+        # sharing a prefix always sit in one contiguous range
+        if self._sorted_values is None:
+            weights = 1 << np.arange(self.width - 1, -1, -1, dtype=np.int64)
+            self._sorted_values = np.sort(self.bits @ weights)
 
-    def most_common(self, column, tiebreaker=1):
-        ones = 0
-        zeroes = 0
+        return self._sorted_values
 
-        for val in column:
-            if val == 0:
-                zeroes += 1
-            else:
-                ones += 1
+    def prefix_range(self, prefix, prefix_width):
+        # [lo, hi) of the sorted readings whose top prefix_width bits are prefix
+        shift = self.width - prefix_width
+        values = self.sorted_values
+
+        lo = int(np.searchsorted(values, prefix << shift))
+        hi = int(np.searchsorted(values, (prefix + 1) << shift))
+
+        return lo, hi
+
+    def most_common(self, rows, filter_pos, tiebreaker=1):
+        ones = int(self.bits[rows, filter_pos].sum(dtype=np.int64))
+        zeroes = len(rows) - ones
 
         if zeroes == ones:
             return tiebreaker
@@ -40,35 +52,66 @@ class DiagnosticReport:
         return 1
 
     def filter_rows_by_most_common(self, rows, filter_pos, invert=False):
-        cols = self.rows_to_columns(rows)
-
-        filter_val = self.most_common(cols[filter_pos])
+        # rows is an array of row indices into self.bits
+        filter_val = self.most_common(rows, filter_pos)
 
         if invert:
-            mapping = {0: 1, 1: 0}
-            filter_val = mapping[filter_val]
+            filter_val = 1 - filter_val
 
-        return [row for row in rows if row[filter_pos] == filter_val]
+        return rows[self.bits[rows, filter_pos] == filter_val]
 
-    @property
-    def oxygen_consumption(self):
-        rows = self.rows
+    def rating(self, invert=False):
+        rows = np.arange(self.height)
 
         for idx in range(self.width):
-            rows = self.filter_rows_by_most_common(rows, idx)
+            if len(rows) == 1:
+                break
 
-        return int(''.join(map(str, rows[0])), 2)
+            rows = self.filter_rows_by_most_common(rows, idx, invert=invert)
 
-    @property
-    def co2_scrubber_rating(self):
-        rows = self.rows
+        return self.row_value(rows[0])
 
-        for idx in range(self.width):
-            rows = self.filter_rows_by_most_common(rows, idx, invert=True)
-            if len(rows) == 1:
+    def sorted_rating(self, invert=False, prefix=0, prefix_width=0):
+        # The same search as rating, but over a range of the sorted readings:
+        # within the range the ones for the next bit all follow the zeroes,
+        # so one bisection per bit finds the split. Starting from a prefix
+        # rates just the readings beginning with it.
+        values = self.sorted_values
+        lo, hi = self.prefix_range(prefix, prefix_width)
+        prefix <<= self.width - prefix_width
+
+        for idx in range(prefix_width, self.width):
+            if hi - lo <= 1:
                 break
 
-        return int(''.join(map(str, rows[0])), 2)
+            bit = 1 << (self.width - 1 - idx)
+            mid = int(np.searchsorted(values[lo:hi], prefix | bit)) + lo
+
+            zeroes = mid - lo
+            ones = hi - mid
+            keep_ones = ones >= zeroes
+
+            if invert:
+                keep_ones = not keep_ones
+
+            if keep_ones:
+                lo = mid
+                prefix |= bit
+            else:
+                hi = mid
+
+        if lo == hi:
+            raise Exception("No readings left to rate")
+
+        return int(values[lo])
+
+    @property
+    def oxygen_consumption(self):
+        return self.rating()
+
+    @property
+    def co2_scrubber_rating(self):
+        return self.rating(invert=True)
 
     @property
     def life_support_rating(self):
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class BingoBoard:
     def __init__(self, values):
         self.rows = []
@@ -8,39 +11,48 @@ class BingoBoard:
         for y, row in enumerate(values):
             self.rows.append([BingoCell(v) for v in row])
 
+        # Where each value sits, and how many cells of each row and column
+        # have been marked, so a call only touches matching cells
+        self.positions = {}
+        for y, row in enumerate(values):
+            for x, value in enumerate(row):
+                self.positions.setdefault(value, []).append((y, x))
+
+        self.row_hits = [0] * self.height
+        self.column_hits = [0] * self.width
+        self.unmarked_total = sum(sum(row) for row in values)
+        self.complete = False
+
     @property
     def columns(self):
         return list(map(list, zip(*self.rows)))
 
     def register_value(self, value):
-        for row in self.rows:
-            for cell in row:
-                cell.register_value(value)
+        for y, x in self.positions.get(value, ()):
+            self.mark(y, x)
 
         self.history.append(value)
 
-    @property
-    def is_complete(self):
-        for row in self.rows:
-            if all([cell.filled for cell in row]):
-                return True
+    def mark(self, y, x):
+        cell = self.rows[y][x]
+        if cell.filled:
+            return
 
-        for column in self.columns:
-            if all([cell.filled for cell in column]):
-                return True
+        cell.filled = True
+        self.unmarked_total -= cell.value
+        self.row_hits[y] += 1
+        self.column_hits[x] += 1
 
-        return False
+        if self.row_hits[y] == self.width or self.column_hits[x] == self.height:
+            self.complete = True
 
     @property
-    def score(self):
-        unmarked_total = 0
-
-        for row in self.rows:
-            for cell in row:
-                if not cell.filled:
-                    unmarked_total = unmarked_total + cell.value
+    def is_complete(self):
+        return self.complete
 
-        return unmarked_total * self.history[-1]
+    @property
+    def score(self):
+        return self.unmarked_total * self.history[-1]
 
 
 class BingoCell:
@@ -53,25 +65,96 @@ class BingoCell:
             self.filled = True
 
 
+def build_index(boards):
+    # value -> every (board, y, x) it appears at, in board order
+    index = {}
+
+    for board in boards:
+        for value, positions in board.positions.items():
+            for y, x in positions:
+                index.setdefault(value, []).append((board, y, x))
+
+    return index
+
+
 def run_game(boards, numbers):
+    index = build_index(boards)
     completed_boards = []
 
     for number in numbers:
-        for board in boards:
-            if board in completed_boards:
+        for board, y, x in index.get(number, ()):
+            if board.is_complete:
                 continue
 
-            board.register_value(number)
+            board.mark(y, x)
+
             if board.is_complete:
+                board.history.append(number)
                 completed_boards.append(board)
 
     return completed_boards
 
 
-def main():
-    with open("input", "r") as f:
-        numbers_raw = f.readline()
-        boards_raw = f.read()
+def board_arrays(boards):
+    # (boards, height, width) arrays of values and of which cells exist, so
+    # boards smaller than the largest one can share the array
+    height = max(board.height for board in boards)
+    width = max(board.width for board in boards)
+    values = np.zeros((len(boards), height, width), dtype=np.int64)
+    present = np.zeros((len(boards), height, width), dtype=bool)
+
+    for idx, board in enumerate(boards):
+        for y, row in enumerate(board.rows):
+            values[idx, y, :len(row)] = [cell.value for cell in row]
+            present[idx, y, :len(row)] = True
+
+    return values, present
+
+
+def win_turns(values, present, numbers):
+    # Each cell is replaced by the turn its number is called on, a row or
+    # column is finished on its latest turn and a board wins on its earliest
+    # finished line. Boards that never win get len(numbers).
+    never = len(numbers)
+    turn_of = np.full(max(int(values.max()), max(numbers)) + 1, never)
+
+    for turn, number in reversed(list(enumerate(numbers))):
+        turn_of[number] = turn
+
+    turns = np.where(present, turn_of[values], -1)
+    row_turns = np.where(present.any(axis=2), turns.max(axis=2), never).min(axis=1)
+    column_turns = np.where(present.any(axis=1), turns.max(axis=1), never).min(axis=1)
+
+    return turns, np.minimum(row_turns, column_turns)
+
+
+def vectorized_winners(boards, numbers):
+    # (board index, score) of the first and last boards to win, in one pass
+    # over every board at once
+    values, present = board_arrays(boards)
+    turns, board_turns = win_turns(values, present, numbers)
+
+    winners = np.flatnonzero(board_turns < len(numbers))
+    if not len(winners):
+        return None, None
+
+    first = int(winners[np.argmin(board_turns[winners])])
+    # Boards finishing on the same turn finish in board order
+    last_turn = board_turns[winners].max()
+    last = int(winners[board_turns[winners] == last_turn][-1])
+
+    results = []
+
+    for idx in (first, last):
+        turn = board_turns[idx]
+        unmarked_total = int(values[idx][turns[idx] > turn].sum())
+        results.append((idx, unmarked_total * numbers[turn]))
+
+    return results[0], results[1]
+
+
+def read_game(content):
+    numbers_raw, boards_raw = content.split("\n", 1)
 
     numbers = [int(n) for n in numbers_raw.split(",")]
 
@@ -87,6 +170,13 @@ def main():
 
         boards.append(BingoBoard(rows))
 
+    return boards, numbers
+
+
+def main():
+    with open("input", "r") as f:
+        boards, numbers = read_game(f.read())
+
     completed_boards = run_game(boards, numbers)
     print(completed_boards[-1].score)
 
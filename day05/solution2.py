@@ -1,5 +1,9 @@
+import bisect
+import math
 import re
 
+import numpy as np
+
 
 class Line:
     def __init__(self, x0, y0, x1, y1):
@@ -28,6 +32,35 @@ class Line:
             int(match.group("y1")),
         )
 
+    @property
+    def orientation(self):
+        if self.x0 == self.x1:
+            return "vertical"
+
+        if self.y0 == self.y1:
+            return "horizontal"
+
+        if abs(self.x0 - self.x1) == abs(self.y0 - self.y1):
+            return "diagonal"
+
+        raise Exception("Unsupported line: %s,%s -> %s,%s" % (self.x0, self.y0, self.x1, self.y1))
+
+    @property
+    def segment(self):
+        # (family, key, lo, hi), see FAMILY_COEFFICIENTS
+        orientation = self.orientation
+
+        if orientation == "vertical":
+            return "vertical", self.x0, min(self.y0, self.y1), max(self.y0, self.y1)
+
+        if orientation == "horizontal":
+            return "horizontal", self.y0, min(self.x0, self.x1), max(self.x0, self.x1)
+
+        if (self.x1 - self.x0) * (self.y1 - self.y0) > 0:
+            return "rising", self.y0 - self.x0, min(self.x0, self.x1), max(self.x0, self.x1)
+
+        return "falling", self.x0 + self.y0, min(self.x0, self.x1), max(self.x0, self.x1)
+
     def intersects(self, x, y):
         return y == self.a * x + self.b
 
@@ -50,28 +83,260 @@ class Line:
         return points
 
 
-def main():
-    with open("input", "r") as f:
-        lines_raw = f.read().splitlines()
+# Every line lies along one of four families, each written as
+# a * x + b * y = key. Points along a family are parameterised by x, apart
+# from vertical lines which use y.
+FAMILY_COEFFICIENTS = {
+    "horizontal": (0, 1),
+    "vertical": (1, 0),
+    "rising": (-1, 1),
+    "falling": (1, 1),
+}
 
-    lines = [Line.from_str(line_raw) for line_raw in lines_raw]
 
-    points = {}
+def family_param(family, x, y):
+    return y if family == "vertical" else x
+
+
+def sweep_intervals(intervals):
+    # Returns the stretches covered at least once and at least twice, as
+    # sorted, disjoint inclusive (lo, hi) pairs
+    events = {}
+
+    for lo, hi in intervals:
+        events[lo] = events.get(lo, 0) + 1
+        events[hi + 1] = events.get(hi + 1, 0) - 1
+
+    covered = []
+    doubled = []
+    depth = 0
+    covered_start = None
+    doubled_start = None
+
+    for t in sorted(events):
+        depth += events[t]
+
+        if depth >= 1 and covered_start is None:
+            covered_start = t
+        elif depth < 1 and covered_start is not None:
+            covered.append((covered_start, t - 1))
+            covered_start = None
+
+        if depth >= 2 and doubled_start is None:
+            doubled_start = t
+        elif depth < 2 and doubled_start is not None:
+            doubled.append((doubled_start, t - 1))
+            doubled_start = None
+
+    return covered, doubled
+
+
+def in_intervals(intervals, t):
+    idx = bisect.bisect_right(intervals, (t, math.inf)) - 1
+    return idx >= 0 and intervals[idx][0] <= t <= intervals[idx][1]
+
+
+def segment_ends(segment):
+    family, key, lo, hi = segment
+
+    if family == "vertical":
+        return (key, lo), (key, hi)
+
+    a, b = FAMILY_COEFFICIENTS[family]
+    return (lo, key - a * lo), (hi, key - a * hi)
+
+
+def sweep_crossings(segments1, segments2):
+    # Lattice points where segments of two families cross. Measured as s and
+    # t, each family's own a * x + b * y, every segment of the first family
+    # sits at one s and every segment of the second at one t. Sweeping s with
+    # the second family's active segments kept ordered by t turns each first
+    # family segment into a range query, so only segments that actually
+    # cross are ever paired up.
+    family1 = segments1[0][0]
+    family2 = segments2[0][0]
+    a1, b1 = FAMILY_COEFFICIENTS[family1]
+    a2, b2 = FAMILY_COEFFICIENTS[family2]
+    det = a1 * b2 - a2 * b1
+
+    # At equal s, segments start before queries, which come before segments
+    # end, as the ranges are inclusive
+    events = []
+
+    for segment in segments2:
+        s_values = [a1 * x + b1 * y for x, y in segment_ends(segment)]
+        events.append((min(s_values), 0, segment))
+        events.append((max(s_values), 2, segment))
+
+    for segment in segments1:
+        events.append((segment[1], 1, segment))
+
+    events.sort(key=lambda event: event[:2])
+
+    # Segments of one family with the same key never overlap, so each t is
+    # active at most once
+    active_keys = []
+    points = []
+
+    for s, kind, segment in events:
+        if kind == 0:
+            bisect.insort(active_keys, segment[1])
+        elif kind == 2:
+            del active_keys[bisect.bisect_left(active_keys, segment[1])]
+        else:
+            t_values = [a2 * x + b2 * y for x, y in segment_ends(segment)]
+            start = bisect.bisect_left(active_keys, min(t_values))
+            end = bisect.bisect_right(active_keys, max(t_values))
+
+            # Both ranges hold already, all that's left is whether the lines
+            # meet on a lattice point
+            for key in active_keys[start:end]:
+                x_num = s * b2 - key * b1
+                y_num = a1 * key - a2 * s
+
+                if not (x_num % det or y_num % det):
+                    points.append((x_num // det, y_num // det))
+
+    return points
+
+
+def count_overlaps(lines):
+    # Exact integer count of points covered by two or more lines, working on
+    # intervals rather than individual points
+    groups = {}
 
     for line in lines:
-        for x, y in line.grid_intersections():
-            if (x, y) not in points:
-                points[(x, y)] = 0
+        family, key, lo, hi = line.segment
+        groups.setdefault((family, key), []).append((lo, hi))
+
+    covered_segments = []
+    doubled = {}
+    total = 0
+
+    for (family, key), intervals in groups.items():
+        covered, doubled_intervals = sweep_intervals(intervals)
+
+        covered_segments.extend((family, key, lo, hi) for lo, hi in covered)
+        doubled[(family, key)] = doubled_intervals
+        total += sum(hi - lo + 1 for lo, hi in doubled_intervals)
+
+    # Points where different families cross. Each one was counted once per
+    # family it's already doubled up in, but should be counted exactly once.
+    by_family = {}
+    for segment in covered_segments:
+        by_family.setdefault(segment[0], []).append(segment)
+
+    families = list(by_family)
+    crossings = set()
+
+    for idx, family1 in enumerate(families):
+        for family2 in families[idx + 1:]:
+            crossings.update(sweep_crossings(by_family[family1], by_family[family2]))
+
+    for x, y in crossings:
+        times_counted = 0
+
+        for family, (a, b) in FAMILY_COEFFICIENTS.items():
+            key = a * x + b * y
+            if in_intervals(doubled.get((family, key), []), family_param(family, x, y)):
+                times_counted += 1
+
+        total += 1 - times_counted
+
+    return total
+
+
+def rasterise(x0, y0, x1, y1, width):
+    # Grid cell of every point on the given lines, all generated at once with
+    # index arithmetic. Coordinates are already relative to the grid.
+    lengths = np.maximum(np.abs(x1 - x0), np.abs(y1 - y0)) + 1
+    line_ids = np.repeat(np.arange(len(lengths), dtype=np.int32), lengths)
+    starts = (np.cumsum(lengths) - lengths).astype(np.int32)
+    steps = np.arange(int(lengths.sum()), dtype=np.int32) - np.repeat(starts, lengths)
+
+    xs = x0[line_ids] + np.sign(x1 - x0)[line_ids] * steps
+    ys = y0[line_ids] + np.sign(y1 - y0)[line_ids] * steps
+
+    return ys * width + xs
+
+
+# Points rasterised per batch in the dense backend
+DENSE_BATCH_POINTS = 1 << 22
+
+
+def count_overlaps_dense(lines):
+    # Tallies every point into an int32 grid covering the bounding box, a
+    # batch of lines at a time. Within a batch np.unique merges repeated
+    # cells, so each cell is only added to once. choose_backend keeps the
+    # grid small enough for int32 cell indices.
+    x0 = np.array([line.x0 for line in lines], dtype=np.int64)
+    y0 = np.array([line.y0 for line in lines], dtype=np.int64)
+    x1 = np.array([line.x1 for line in lines], dtype=np.int64)
+    y1 = np.array([line.y1 for line in lines], dtype=np.int64)
+
+    min_x = min(x0.min(), x1.min())
+    min_y = min(y0.min(), y1.min())
+    width = int(max(x0.max(), x1.max()) - min_x + 1)
+    height = int(max(y0.max(), y1.max()) - min_y + 1)
+
+    x0, x1 = (x0 - min_x).astype(np.int32), (x1 - min_x).astype(np.int32)
+    y0, y1 = (y0 - min_y).astype(np.int32), (y1 - min_y).astype(np.int32)
 
-            points[(x, y)] += 1
+    ends = np.cumsum(np.maximum(np.abs(x1 - x0), np.abs(y1 - y0)).astype(np.int64) + 1)
+    grid = np.zeros(width * height, dtype=np.int32)
+    start = 0
 
-    intersections = 0
+    while start < len(lines):
+        done = ends[start - 1] if start else 0
+        end = max(int(np.searchsorted(ends, done + DENSE_BATCH_POINTS, side="right")), start + 1)
 
-    for count in points.values():
-        if count > 1:
-            intersections += 1
+        cells, counts = np.unique(rasterise(x0[start:end], y0[start:end], x1[start:end], y1[start:end], width), return_counts=True)
+        grid[cells] += counts.astype(np.int32)
+
+        start = end
+
+    return int(np.count_nonzero(grid > 1))
+
+
+# Rasterising wins until the bounding box is much bigger than the lines in it,
+# and is never used past a fixed size so memory stays bounded however far
+# apart the coordinates are
+DENSE_AREA_PER_POINT = 16
+DENSE_MAX_CELLS = 3 * 10 ** 7
+
+
+def choose_backend(lines):
+    min_x = min(min(line.x0, line.x1) for line in lines)
+    max_x = max(max(line.x0, line.x1) for line in lines)
+    min_y = min(min(line.y0, line.y1) for line in lines)
+    max_y = max(max(line.y0, line.y1) for line in lines)
+
+    area = (max_x - min_x + 1) * (max_y - min_y + 1)
+    total_length = sum(max(abs(line.x1 - line.x0), abs(line.y1 - line.y0)) + 1 for line in lines)
+
+    if area > DENSE_MAX_CELLS or total_length > DENSE_MAX_CELLS:
+        return count_overlaps
+
+    if area <= DENSE_AREA_PER_POINT * total_length:
+        return count_overlaps_dense
+
+    return count_overlaps
+
+
+def count_intersections(lines):
+    if not lines:
+        return 0
+
+    return choose_backend(lines)(lines)
+
+
+def main():
+    with open("input", "r") as f:
+        lines_raw = f.read().splitlines()
+
+    lines = [Line.from_str(line_raw) for line_raw in lines_raw]
 
-    print(intersections)
+    print(count_intersections(lines))
 
 
 if __name__ == "__main__":
@@ -1,3 +1,19 @@
+TRANSITION_POWERS = {}
+
+
+def mat_mul(a, b):
+    b_cols = list(zip(*b))
+    return [[sum(x * y for x, y in zip(row, col)) for col in b_cols] for row in a]
+
+
+def mat_vec(m, v):
+    return [sum(x * y for x, y in zip(row, v)) for row in m]
+
+
+def vec_mat(v, m):
+    return [sum(x * y for x, y in zip(v, col)) for col in zip(*m)]
+
+
 class FishPopulation:
     breeding_cycle_days = 7
     childhood_length = 2
@@ -26,9 +42,70 @@ class FishPopulation:
 
         self.counts = new_counts
 
+    @classmethod
+    def transition_matrix(cls):
+        # The same step as tick(), as a matrix acting on the counts
+        size = cls.breeding_cycle_days + cls.childhood_length
+        matrix = [[0] * size for _ in range(size)]
+
+        for idx in range(size - 1):
+            matrix[idx][idx + 1] = 1
+
+        matrix[cls.breeding_cycle_days - 1][0] += 1
+        matrix[size - 1][0] += 1
+
+        return matrix
+
+    @classmethod
+    def transition_power(cls, k):
+        # transition_matrix() ** (2 ** k), squared up once and reused by every population
+        key = (cls.breeding_cycle_days, cls.childhood_length)
+        powers = TRANSITION_POWERS.setdefault(key, [cls.transition_matrix()])
+
+        while len(powers) <= k:
+            powers.append(mat_mul(powers[-1], powers[-1]))
+
+        return powers[k]
+
     def fast_forward(self, num_ticks):
-        for _ in range(num_ticks):
-            self.tick()
+        k = 0
+
+        while num_ticks:
+            if num_ticks & 1:
+                self.counts = mat_vec(self.transition_power(k), self.counts)
+
+            num_ticks >>= 1
+            k += 1
+
+    @classmethod
+    def total_weights(cls, num_ticks):
+        # How many fish each starting timer value turns into after num_ticks
+        weights = [1] * (cls.breeding_cycle_days + cls.childhood_length)
+        k = 0
+
+        while num_ticks:
+            if num_ticks & 1:
+                weights = vec_mat(weights, cls.transition_power(k))
+
+            num_ticks >>= 1
+            k += 1
+
+        return weights
+
+    @classmethod
+    def forecast(cls, populations, tick_counts):
+        # Totals for every population after every number of ticks. The weights
+        # for each tick count are worked out once, then every population is
+        # just a dot product.
+        results = [[None] * len(tick_counts) for _ in populations]
+
+        for j, num_ticks in enumerate(tick_counts):
+            weights = cls.total_weights(num_ticks)
+
+            for i, population in enumerate(populations):
+                results[i][j] = sum(w * c for w, c in zip(weights, population.counts))
+
+        return results
 
     @property
     def total(self):
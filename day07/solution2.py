@@ -1,3 +1,52 @@
+import numbers
+
+import numpy as np
+from scipy import signal
+
+
+def exact_convolve(counts, kernel):
+    # FFT convolution of integers is only exact while every output fits
+    # comfortably in a float's mantissa. Integer kernels are split into limbs
+    # small enough for that, convolved one limb at a time and recombined.
+    # Object kernels of Python ints take the same path, only real floating
+    # kernels go through the FFT as they are.
+    if kernel.dtype == object:
+        if not all(isinstance(value, numbers.Integral) for value in kernel):
+            return signal.fftconvolve(counts, kernel.astype(np.float64), mode="valid")
+    elif not np.issubdtype(kernel.dtype, np.integer):
+        return signal.fftconvolve(counts, kernel, mode="valid")
+
+    shift = int(kernel.min())
+    span = int(kernel.max()) - shift
+
+    # The limbs are cut in int64, so narrower kernels are widened first, and
+    # kernels spanning more than int64 holds are shifted as Python ints
+    if kernel.dtype == object or span >= 2 ** 63:
+        kernel = np.array([int(value) - shift for value in kernel], dtype=object)
+    elif np.issubdtype(kernel.dtype, np.unsignedinteger):
+        kernel = (kernel - kernel.dtype.type(shift)).astype(np.int64)
+    else:
+        kernel = kernel.astype(np.int64) - shift
+
+    total = int(counts.sum())
+    limb_bits = max(1, 40 - total.bit_length())
+    num_limbs = max(1, -(-span.bit_length() // limb_bits))
+
+    wide = total * (span + abs(shift)) >= 2 ** 62
+    result = np.zeros(len(kernel) - len(counts) + 1, dtype=object if wide else np.int64)
+
+    for idx in range(num_limbs):
+        limb = ((kernel >> (limb_bits * idx)) & ((1 << limb_bits) - 1)).astype(np.int64)
+        limb_result = np.rint(signal.fftconvolve(counts, limb, mode="valid")).astype(np.int64)
+
+        if wide:
+            limb_result = limb_result.astype(object)
+
+        result += limb_result << (limb_bits * idx)
+
+    return result + shift * total
+
+
 class CrabNavy:
     def __init__(self, positions):
         self.positions = positions
@@ -13,16 +62,67 @@ class CrabNavy:
 
         for position in self.positions:
             distance = abs(alignment - position)
-            total += distance * (distance + 1) / 2
+            total += distance * (distance + 1) // 2
 
         return total
 
+    @staticmethod
+    def fuel_costs(num_distances):
+        distances = np.arange(num_distances, dtype=np.int64)
+        return distances * (distances + 1) // 2
+
+    def cost_curve(self, costs=None):
+        # costs[d] is the fuel needed to move d steps. Returns the lowest crab
+        # position and the total consumption for aligning on every position
+        # from there up to the highest crab. The positions are histogrammed
+        # once and convolved with the cost kernel.
+        lowest = min(self.positions)
+        counts = np.bincount(np.asarray(self.positions) - lowest)
+        span = len(counts)
+
+        if costs is None:
+            costs = self.fuel_costs(span)
+
+        costs = np.asarray(costs)
+        if len(costs) < span:
+            raise Exception("Need a cost for every distance up to %s" % (span - 1))
+
+        kernel = np.concatenate((costs[span - 1:0:-1], costs[:span]))
+        curve = exact_convolve(counts, kernel)
+
+        return lowest, curve
+
+    def brute_force_curve(self, costs):
+        # Python numbers, so narrow integer costs can't overflow the sums
+        costs = np.asarray(costs).tolist()
+        lowest = min(self.positions)
+        curve = []
+
+        for alignment in range(lowest, max(self.positions) + 1):
+            curve.append(sum(costs[abs(alignment - position)] for position in self.positions))
+
+        return lowest, curve
+
+    def ideal_alignment_for(self, costs=None):
+        lowest, curve = self.cost_curve(costs)
+        idx = int(np.argmin(curve))
+        consumption = curve[idx]
+
+        # Wide integer curves already hold Python ints
+        if hasattr(consumption, "item"):
+            consumption = consumption.item()
+
+        return lowest + idx, consumption
+
     @property
     def ideal_alignment(self):
+        # The triangular cost is convex and its minimum is always within half a
+        # step of the mean, so only the two integers either side need checking
         min_consumption = None
         min_idx = None
+        mean_floor = sum(self.positions) // len(self.positions)
 
-        for idx in range(min(self.positions), max(self.positions)):
+        for idx in (mean_floor, mean_floor + 1):
             consumption = self.calculate_consumption(idx)
 
             if min_consumption is None or consumption < min_consumption:
@@ -42,6 +142,14 @@ def main():
 
     sample_navy = CrabNavy([16, 1, 2, 0, 4, 2, 7, 1, 2, 14])
     navy = CrabNavy.from_str(lines_raw[0])
+
+    # The convolution has to agree with summing the costs directly, for
+    # narrow integer costs as well as for ones past int64
+    for costs in (np.arange(17, dtype=np.int8), [d ** 20 for d in range(17)]):
+        lowest, curve = sample_navy.cost_curve(costs)
+        if (lowest, list(curve)) != sample_navy.brute_force_curve(costs):
+            raise Exception("Cost curve doesn't match summing the costs")
+
     print(sample_navy.ideal_alignment)
     print(sample_navy.ideal_alignment_consumption)
     print(navy.ideal_alignment_consumption)
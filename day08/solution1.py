@@ -1,4 +1,7 @@
 from collections import defaultdict
+import itertools
+import os
+import pickle
 import re
 
 
@@ -6,11 +9,193 @@ def sort_string(string):
     return "".join(sorted(string))
 
 
+SEGMENT_BITS = {segment: 1 << idx for idx, segment in enumerate("abcdefg")}
+POPCOUNTS = [bin(mask).count("1") for mask in range(128)]
+
+DIGIT_SEGMENTS = (
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+)
+
+# Decoder tables are 128 bytes indexed by segment mask, with this for masks
+# that aren't a digit
+UNKNOWN_DIGIT = 255
+
+
+# Pattern strings repeat a lot across lines, and there are only a few
+# thousand orderings of seven segments
+PATTERN_MASKS = {}
+
+
+def pattern_mask(pattern):
+    mask = PATTERN_MASKS.get(pattern)
+
+    if mask is None:
+        mask = 0
+
+        for segment in pattern:
+            mask |= SEGMENT_BITS[segment]
+
+        PATTERN_MASKS[pattern] = mask
+
+    return mask
+
+
+def decoder_table(patterns):
+    # Works the decoder table out from the patterns themselves. The unique
+    # lengths give 1, 4, 7 and 8, and the rest follow from how much of 1 and
+    # 4 they contain.
+    masks = [pattern_mask(pattern) for pattern in patterns]
+    unique = {}
+
+    for mask in masks:
+        unique[POPCOUNTS[mask]] = mask
+
+    try:
+        one, four, seven, eight = unique[2], unique[4], unique[3], unique[7]
+    except KeyError:
+        raise Exception("Incomplete Combinations (couldn't find 1, 4, 7 and 8)")
+
+    table = bytearray([UNKNOWN_DIGIT]) * 128
+    found = set()
+
+    for mask in masks:
+        if mask == one:
+            digit = 1
+        elif mask == four:
+            digit = 4
+        elif mask == seven:
+            digit = 7
+        elif mask == eight:
+            digit = 8
+        elif POPCOUNTS[mask] == 6:
+            if mask & four == four:
+                digit = 9
+            elif mask & one == one:
+                digit = 0
+            else:
+                digit = 6
+        elif POPCOUNTS[mask] == 5:
+            if mask & one == one:
+                digit = 3
+            elif POPCOUNTS[mask & four] == 3:
+                digit = 5
+            else:
+                digit = 2
+        else:
+            continue
+
+        table[mask] = digit
+        found.add(digit)
+
+    if len(found) != 10:
+        raise Exception("Incomplete Combinations (couldn't tell all ten digits apart)")
+
+    return table
+
+
+def pattern_signature(masks):
+    # The set of ten masks as one int, the same whatever order they came in
+    signature = 0
+
+    for mask in masks:
+        signature |= 1 << mask
+
+    return signature
+
+
+def build_wiring_index():
+    # Every one of the 5040 ways the wires can be crossed, from the signature
+    # of the ten patterns it produces to its decoder table
+    index = {}
+
+    for wiring in itertools.permutations(range(7)):
+        table = bytearray([UNKNOWN_DIGIT]) * 128
+        masks = []
+
+        for digit, segments in enumerate(DIGIT_SEGMENTS):
+            mask = 0
+            for segment in segments:
+                mask |= 1 << wiring[ord(segment) - ord("a")]
+
+            table[mask] = digit
+            masks.append(mask)
+
+        index[pattern_signature(masks)] = bytes(table)
+
+    return index
+
+
+WIRING_INDEX = {}
+
+
+def wiring_index(cache_path=None):
+    # Built on first use. With a cache_path it's loaded from there if it
+    # exists, and saved there after building if it doesn't.
+    if not WIRING_INDEX:
+        if cache_path is not None and os.path.exists(cache_path):
+            with open(cache_path, "rb") as f:
+                WIRING_INDEX.update(pickle.load(f))
+        else:
+            WIRING_INDEX.update(build_wiring_index())
+
+            if cache_path is not None:
+                with open(cache_path, "wb") as f:
+                    pickle.dump(WIRING_INDEX, f)
+
+    return WIRING_INDEX
+
+
+def lookup_table(patterns):
+    table = wiring_index().get(pattern_signature(pattern_mask(pattern) for pattern in patterns))
+
+    if table is None:
+        raise Exception("Incomplete Combinations (no wiring gives %s)" % " ".join(patterns))
+
+    return table
+
+
+def decode_patterns(patterns, outputs, table_for=lookup_table):
+    table = table_for(patterns)
+    message = [table[pattern_mask(output)] for output in outputs]
+
+    if UNKNOWN_DIGIT in message:
+        raise Exception("Unknown output pattern in %s" % " ".join(outputs))
+
+    return message
+
+
+def iter_messages(lines):
+    # Decodes display lines one at a time straight from their text, without
+    # building a Display for each
+    for line in lines:
+        patterns, separator, outputs = line.partition(" | ")
+        if not separator:
+            raise Exception("Invalid Input")
+
+        yield decode_patterns(patterns.split(), outputs.split())
+
+
 class Display:
     def __init__(self, combinations, message_encrypted):
         self.combinations = [sort_string(c) for c in combinations]
         self.message_encrypted = [sort_string(c) for c in message_encrypted]
-        self.message = self.decode(self.message_encrypted)
+        self._message = None
+
+    @property
+    def message(self):
+        if self._message is None:
+            self._message = self.decode(self.message_encrypted)
+
+        return self._message
 
     @classmethod
     def from_str(cls, input_str):
@@ -94,6 +279,12 @@ class Display:
         raise Exception("Incomplete Combinations (couldn't find nine)")
 
     def decode(self, message):
+        return decode_patterns(self.combinations, message)
+
+    def decode_by_masks(self, message):
+        return decode_patterns(self.combinations, message, table_for=decoder_table)
+
+    def decode_by_search(self, message):
         one = self.find_one()
         three = self.find_three(one)
         four = self.find_four()
@@ -122,16 +313,12 @@ class Display:
 
 
 def main():
-    with open("input", "r") as f:
-        lines_raw = f.read().splitlines()
-
-    displays = [Display.from_str(line_raw) for line_raw in lines_raw]
-
     counts = defaultdict(int)
 
-    for display in displays:
-        for num in display.message:
-            counts[num] += 1
+    with open("input", "r") as f:
+        for message in iter_messages(f):
+            for num in message:
+                counts[num] += 1
 
     print(counts[1] + counts[4] + counts[7] + counts[8])
 
@@ -1,58 +1,48 @@
-import statistics
+import numpy as np
 
 
 class TubeMap:
-    def __init__(self, rows):
-        self.rows = rows
-        self.cols = list(map(list, zip(*self.rows)))
-        self.width = len(self.rows[0])
-        self.height = len(self.cols[0])
+    def __init__(self, heights):
+        self.heights = heights
+        self.height, self.width = heights.shape
 
     @classmethod
     def from_raw_lines(cls, lines):
-        rows = []
+        lines = [line.strip() for line in lines if line.strip()]
 
-        for line in lines:
-            if line.strip():
-                rows.append([int(c) for c in line])
+        if not lines or any(len(line) != len(lines[0]) for line in lines):
+            raise Exception("Invalid Input")
 
-        return cls(rows)
+        raw = np.frombuffer("".join(lines).encode("ascii"), dtype=np.uint8)
+        heights = (raw - ord("0")).reshape(len(lines), len(lines[0]))
 
-    @property
-    def minima(self):
-        minima = []
-
-        for y in range(self.height):
-            for x in range(self.width):
-                val = self.rows[y][x]
+        if (heights > 9).any():
+            raise Exception("Invalid Input")
 
-                if x == 0:
-                    is_x_minima = val < self.rows[y][x+1]
-                elif x == self.width - 1:
-                    is_x_minima = val < self.rows[y][x-1]
-                else:
-                    is_x_minima = self.rows[y][x-1] > val < self.rows[y][x+1]
+        return cls(heights)
 
-                if y == 0:
-                    is_y_minima = val < self.rows[y+1][x]
-                elif y == self.height - 1:
-                    is_y_minima = val < self.rows[y-1][x]
-                else:
-                    is_y_minima = self.rows[y+1][x] > val < self.rows[y-1][x]
-
-                if is_x_minima and is_y_minima:
-                    minima.append((x, y, val))
+    @property
+    def minima_mask(self):
+        # Every point against all four neighbours at once. The edges are
+        # padded with a height no point can reach.
+        padded = np.pad(self.heights, 1, constant_values=10)
+        centre = padded[1:-1, 1:-1]
+
+        return (
+            (centre < padded[:-2, 1:-1])
+            & (centre < padded[2:, 1:-1])
+            & (centre < padded[1:-1, :-2])
+            & (centre < padded[1:-1, 2:])
+        )
 
-        return minima
+    @property
+    def minima(self):
+        ys, xs = np.nonzero(self.minima_mask)
+        return [(int(x), int(y), int(self.heights[y, x])) for y, x in zip(ys, xs)]
 
     @property
     def total_risk_factor(self):
-        total = 0
-
-        for x, y, val in self.minima:
-            total += (1 + val)
-
-        return total
+        return int((self.heights[self.minima_mask].astype(np.int64) + 1).sum())
 
 
 def main():
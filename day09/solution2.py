@@ -1,81 +1,128 @@
-import statistics
+import heapq
+import itertools
+
+import numpy as np
+from scipy import ndimage
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+
+
+STRIP_HEIGHT = 1024
 
 
 class TubeMap:
-    def __init__(self, rows):
-        self.rows = rows
-        self.cols = list(map(list, zip(*self.rows)))
-        self.width = len(self.rows[0])
-        self.height = len(self.cols[0])
+    def __init__(self, heights):
+        self.heights = heights
+        self.height, self.width = heights.shape
 
     @classmethod
     def from_raw_lines(cls, lines):
-        rows = []
+        lines = [line.strip() for line in lines if line.strip()]
+
+        if not lines or any(len(line) != len(lines[0]) for line in lines):
+            raise Exception("Invalid Input")
+
+        raw = np.frombuffer("".join(lines).encode("ascii"), dtype=np.uint8)
+        heights = (raw - ord("0")).reshape(len(lines), len(lines[0]))
 
-        for line in lines:
-            if line.strip():
-                rows.append([int(c) for c in line])
+        if (heights > 9).any():
+            raise Exception("Invalid Input")
 
-        return cls(rows)
+        return cls(heights)
 
     @property
-    def basins(self):
-        basins = []
-        points_seen = {}
-        for y in range(self.height):
-            for x in range(self.width):
-                if (x, y) in points_seen or self.rows[y][x] == 9:
-                    continue
+    def basin_labels(self):
+        # Every point that isn't a 9 belongs to the basin of the points it
+        # connects to up, down, left or right, so basins are the connected
+        # components of that mask. Labels are 1.., numbered in reading order.
+        return ndimage.label(self.heights != 9)
+
+    @property
+    def basin_sizes(self):
+        labels, num_basins = self.basin_labels
+        return np.bincount(labels.ravel(), minlength=num_basins + 1)[1:].tolist()
 
-                basin = self.fill_basin(x, y)
-                basins.append(basin)
+    @property
+    def basins(self):
+        labels, num_basins = self.basin_labels
+        basins = [[] for _ in range(num_basins)]
 
-                for point in basin:
-                    points_seen[point] = True
+        ys, xs = np.nonzero(labels)
+        for y, x, label in zip(ys.tolist(), xs.tolist(), labels[ys, xs].tolist()):
+            basins[label - 1].append((x, y))
 
         return basins
 
-    def fill_basin(self, x, y):
-        result = []
-        seen = {}
-        q = []
-        q.append((x, y))
 
-        while q:
-            n = q.pop(0)
+def iter_strips(lines, strip_height=STRIP_HEIGHT):
+    # Heights a few rows at a time from any iterable of lines, such as an
+    # open file
+    lines = (line for line in lines if line.strip())
+    width = None
 
-            if n in seen:
-                continue
+    while True:
+        strip_lines = list(itertools.islice(lines, strip_height))
+        if not strip_lines:
+            return
 
-            seen[n] = True
+        heights = TubeMap.from_raw_lines(strip_lines).heights
 
-            val = self.rows[n[1]][n[0]]
+        if width is not None and heights.shape[1] != width:
+            raise Exception("Invalid Input")
 
-            if n[0] >= 0 and n[1] >= 0 and val not in (None, 9):
-                result.append(n)
+        width = heights.shape[1]
+        yield heights
 
-                adjacent_nodes = (
-                    (n[0] - 1, n[1]),
-                    (n[0] + 1, n[1]),
-                    (n[0], n[1] - 1),
-                    (n[0], n[1] + 1),
-                )
 
-                for a in adjacent_nodes:
-                    if a not in seen and a[0] >= 0 and a[1] >= 0 and a[0] < self.width and a[1] < self.height:
-                        q.append(a)
+def iter_basin_sizes(lines, strip_height=STRIP_HEIGHT):
+    # Labels each strip on its own, then joins its basins to the ones still
+    # open along the bottom row of the strip before. A basin is finished,
+    # and its size yielded, once it no longer reaches the latest bottom row,
+    # so only one strip and that row's basins are held at any time.
+    open_sizes = np.zeros(0, dtype=np.int64)
+    # For each point on the last bottom row, its open basin, or -1 for a 9
+    open_row = None
 
-        return result
+    for heights in iter_strips(lines, strip_height):
+        labels, num_labels = ndimage.label(heights != 9)
+
+        # Nodes are the open basins followed by this strip's labels
+        num_open = len(open_sizes)
+        num_nodes = num_open + num_labels
+        node_sizes = np.concatenate((open_sizes, np.bincount(labels.ravel(), minlength=num_labels + 1)[1:]))
+
+        if open_row is not None:
+            joined = (open_row >= 0) & (labels[0] > 0)
+            edges = (open_row[joined], labels[0][joined] - 1 + num_open)
+        else:
+            edges = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+
+        graph = coo_matrix((np.ones(len(edges[0])), edges), shape=(num_nodes, num_nodes))
+        num_components, components = connected_components(graph, directed=False)
+
+        component_sizes = np.zeros(num_components, dtype=np.int64)
+        np.add.at(component_sizes, components, node_sizes)
+
+        bottom = labels[-1]
+        bottom_components = components[bottom[bottom > 0] - 1 + num_open]
+        still_open = np.unique(bottom_components)
+
+        finished = np.ones(num_components, dtype=bool)
+        finished[still_open] = False
+        yield from component_sizes[finished].tolist()
+
+        open_sizes = component_sizes[still_open]
+        open_row = np.full(bottom.shape, -1, dtype=np.int64)
+        open_row[bottom > 0] = np.searchsorted(still_open, bottom_components)
+
+    yield from open_sizes.tolist()
 
 
 def main():
     with open("input", "r") as f:
-        lines = f.read().splitlines()
-
-    tube_map = TubeMap.from_raw_lines(lines)
+        sorted_sizes = heapq.nlargest(3, iter_basin_sizes(f))
 
-    sorted_basins = sorted(tube_map.basins, key=lambda b: -len(b))
-    print(len(sorted_basins[0]) * len(sorted_basins[1]) * len(sorted_basins[2]))
+    print(sorted_sizes[0] * sorted_sizes[1] * sorted_sizes[2])
 
 
 
@@ -6,6 +6,8 @@ class Line:
         ("<", ">", 25137),
     )
 
+    START_TO_END = {m[0]: m[1] for m in CHUNK_MARKERS}
+
     def __init__(self, line_str):
         self.line_str = line_str
 
@@ -24,13 +26,11 @@ class Line:
         return f"{self.line_str} - OK"
 
     def parse(self):
-        starting_markers = [m[0] for m in self.CHUNK_MARKERS]
-        start_to_end = {m[0]: m[1] for m in self.CHUNK_MARKERS}
-
+        start_to_end = self.START_TO_END
         stack = []
 
         for c in self.line_str:
-            if c in starting_markers:
+            if c in start_to_end:
                 stack.append(c)
                 continue
 
@@ -8,6 +8,8 @@ class Line:
         ("<", ">", 25137, 4),
     )
 
+    START_TO_END = {m[0]: m[1] for m in CHUNK_MARKERS}
+
     def __init__(self, line_str):
         self.line_str = line_str
 
@@ -27,13 +29,11 @@ class Line:
         return f"{self.line_str} - OK"
 
     def parse(self):
-        starting_markers = [m[0] for m in self.CHUNK_MARKERS]
-        start_to_end = {m[0]: m[1] for m in self.CHUNK_MARKERS}
-
+        start_to_end = self.START_TO_END
         stack = []
 
         for c in self.line_str:
-            if c in starting_markers:
+            if c in start_to_end:
                 stack.append(c)
                 continue
 
@@ -51,10 +51,7 @@ class Line:
 
         if stack:
             self.is_incomplete = True
-            self.completion_str = ""
-
-            while stack:
-                self.completion_str += start_to_end[stack.pop()]
+            self.completion_str = "".join(start_to_end[c] for c in reversed(stack))
 
     @property
     def corruption_score(self):
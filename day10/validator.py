@@ -0,0 +1,113 @@
+import mmap
+import statistics
+
+
+CHUNK_SIZE = 1 << 20
+
+# Every byte is translated to a code once per chunk: 1-4 open a chunk, 5-8
+# close the matching one and NEWLINE ends a line. Carriage returns are
+# dropped, and anything else closes nothing and corrupts the line.
+NEWLINE = 9
+UNKNOWN = 10
+
+OPENERS = b"([{<"
+CLOSERS = b")]}>"
+
+BYTE_CODES = bytearray([UNKNOWN]) * 256
+for code, (opener, closer) in enumerate(zip(OPENERS, CLOSERS), 1):
+    BYTE_CODES[opener] = code
+    BYTE_CODES[closer] = code + 4
+BYTE_CODES[ord("\n")] = NEWLINE
+BYTE_CODES = bytes(BYTE_CODES)
+DROPPED = b"\r"
+
+CORRUPTION_SCORES = (0, 0, 0, 0, 0, 3, 57, 1197, 25137, 0, 0)
+
+# Completion scores are the closers still owed, read as base 5 digits. int()
+# refuses very long non-binary strings, so long ones are converted in pieces.
+COMPLETION_DIGITS = bytes.maketrans(b"\x01\x02\x03\x04", b"1234")
+COMPLETION_PIECE = 4000
+
+
+def completion_score(stack):
+    digits = stack[::-1].translate(COMPLETION_DIGITS)
+    score = 0
+
+    for start in range(0, len(digits), COMPLETION_PIECE):
+        piece = digits[start:start + COMPLETION_PIECE]
+        score = score * 5 ** len(piece) + int(piece, 5)
+
+    return score
+
+
+def validate(chunks):
+    # Takes the input as any iterable of bytes, split anywhere, and returns
+    # the total corruption score and the completion score of every
+    # incomplete line. Nothing is kept per line beyond the open chunks.
+    corruption_total = 0
+    completion_scores = []
+
+    stack = bytearray()
+    corrupted = False
+
+    for chunk in chunks:
+        # Every piece after the first starts a new line, and the last one
+        # carries on into the next chunk
+        pieces = chunk.translate(BYTE_CODES, DROPPED).split(bytes([NEWLINE]))
+
+        for idx, piece in enumerate(pieces):
+            if idx:
+                if stack and not corrupted:
+                    completion_scores.append(completion_score(stack))
+
+                stack.clear()
+                corrupted = False
+
+            if corrupted:
+                continue
+
+            for code in piece:
+                if code <= 4:
+                    stack.append(code)
+                elif stack and stack[-1] == code - 4:
+                    stack.pop()
+                else:
+                    corrupted = True
+                    corruption_total += CORRUPTION_SCORES[code]
+                    break
+
+    if stack and not corrupted:
+        completion_scores.append(completion_score(stack))
+
+    return corruption_total, completion_scores
+
+
+def iter_chunks(f, chunk_size=CHUNK_SIZE):
+    while chunk := f.read(chunk_size):
+        yield chunk
+
+
+def iter_mapped_chunks(mapped, chunk_size=CHUNK_SIZE):
+    for start in range(0, len(mapped), chunk_size):
+        yield mapped[start:start + chunk_size]
+
+
+def validate_file(path, chunk_size=CHUNK_SIZE):
+    with open(path, "rb") as f:
+        # mmap can't map an empty file
+        if not f.seek(0, 2):
+            return 0, []
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return validate(iter_mapped_chunks(mapped, chunk_size))
+
+
+def main():
+    corruption_total, completion_scores = validate_file("input")
+
+    print(corruption_total)
+    print(statistics.median(completion_scores))
+
+
+if __name__ == "__main__":
+    main()
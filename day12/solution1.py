@@ -16,6 +16,36 @@ class Node:
         self.neighbours = neighbours
 
 
+class SharedPath:
+    # Persistent path that only stores its last node and a link to the path
+    # it extends, so every path branching off the same prefix shares it
+    def __init__(self, node, parent=None):
+        self.node = node
+        self.parent = parent
+        self.length = 1 if parent is None else parent.length + 1
+
+    def __str__(self):
+        return ",".join(n.name for n in self.nodes)
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return iter(self.nodes)
+
+    @property
+    def nodes(self):
+        nodes = []
+        path = self
+
+        while path is not None:
+            nodes.append(path.node)
+            path = path.parent
+
+        nodes.reverse()
+        return nodes
+
+
 class TraversalTree:
     def __init__(self, path):
         self.path = path
@@ -50,6 +80,50 @@ class TraversalTree:
         return [a.path for a in self.complete_ancestors]
 
 
+class CaveIndex:
+    # Compact integer view of the network. Every cave gets an id, neighbours
+    # are lists of ids and small caves also get a bit so sets of them can be
+    # held in a single int. Bits are numbered over the small caves alone, so
+    # big caves don't widen every mask.
+    def __init__(self, nodes, edges):
+        self.nodes = list(nodes)
+        self.ids = {node: idx for idx, node in enumerate(self.nodes)}
+        self.bits = []
+
+        num_small = 0
+        for node in self.nodes:
+            if node.small:
+                self.bits.append(1 << num_small)
+                num_small += 1
+            else:
+                self.bits.append(0)
+
+        neighbours = [{} for _ in self.nodes]
+
+        for n1, n2 in edges:
+            id1 = self.ids[n1]
+            id2 = self.ids[n2]
+            neighbours[id1][id2] = True
+            neighbours[id2][id1] = True
+
+        self.adjacency = [list(n) for n in neighbours]
+        self.small_adjacency = [0] * len(self.nodes)
+
+        for idx, n in enumerate(self.adjacency):
+            for other in n:
+                self.small_adjacency[idx] |= self.bits[other]
+
+        self.start = None
+        self.end = None
+
+        for idx, node in enumerate(self.nodes):
+            if node.start:
+                self.start = idx
+
+            if node.end:
+                self.end = idx
+
+
 class Network:
     def __init__(self, nodes, edges):
         self.nodes = nodes
@@ -67,25 +141,111 @@ class Network:
         if not self.start and self.end:
             raise Exception("Network Incomplete")
 
-        for node in self.nodes:
-            node.set_neighbours(self.find_neighbours(node))
+        self.index = CaveIndex(nodes, edges)
 
-        self.traversal_tree = self.build_traversal_tree()
-        self.paths = self.traversal_tree.paths
+        for idx, node in enumerate(self.index.nodes):
+            node.set_neighbours({self.index.nodes[n] for n in self.index.adjacency[idx]})
 
-    def build_traversal_tree(self):
-        return TraversalTree([self.start])
+        self.traversal_tree = None
+        self._paths = None
+
+    @property
+    def paths(self):
+        # Materialising every path is expensive, only do it when asked
+        if self._paths is None:
+            self.traversal_tree = self.build_traversal_tree()
+            self._paths = self.traversal_tree.paths
+
+        return self._paths
+
+    def count_paths(self):
+        # Small caves visited so far are tracked as a bitmask, which together
+        # with the current cave fully determines how many ways there are to
+        # finish. The search keeps its own stack so long paths don't hit the
+        # recursion limit.
+        adjacency = self.index.adjacency
+        bits = self.index.bits
+        start = self.index.start
+        end = self.index.end
+
+        def successors(u, visited):
+            for v in adjacency[u]:
+                if v == start:
+                    continue
+
+                if not bits[v]:
+                    yield v, visited
+                elif not visited & bits[v]:
+                    yield v, visited | bits[v]
+
+        root = (start, bits[start])
+
+        if start == end:
+            return 1
+
+        cache = {}
+        on_stack = {root}
+        # Each frame is [state, its remaining successors, paths counted so far]
+        stack = [[root, successors(*root), 0]]
+
+        while stack:
+            frame = stack[-1]
+
+            for child in frame[1]:
+                if child[0] == end:
+                    frame[2] += 1
+                elif child in cache:
+                    frame[2] += cache[child]
+                elif child in on_stack:
+                    raise Exception("Big caves are connected, there are infinitely many paths")
+                else:
+                    on_stack.add(child)
+                    stack.append([child, successors(*child), 0])
+                    break
+            else:
+                stack.pop()
+                on_stack.discard(frame[0])
+                cache[frame[0]] = frame[2]
 
-    def find_neighbours(self, node):
-        neighbours = []
+                if stack:
+                    stack[-1][2] += frame[2]
 
-        for n1, n2 in self.edges:
-            if n1 == node:
-                neighbours.append(n2)
-            if n2 == node:
-                neighbours.append(n1)
+        return cache[root]
+
+    def iter_paths(self, limit=None):
+        # Depth first, yielding each complete path as soon as it is found.
+        # Stop early by passing a limit or simply closing the generator.
+        nodes = self.index.nodes
+        adjacency = self.index.adjacency
+        bits = self.index.bits
+        start = self.index.start
+        end = self.index.end
+
+        stack = [(start, SharedPath(nodes[start]), bits[start])]
+        found = 0
+
+        while stack:
+            if limit is not None and found >= limit:
+                return
+
+            u, path, visited = stack.pop()
 
-        return set(neighbours)
+            if u == end:
+                found += 1
+                yield path
+                continue
+
+            for v in adjacency[u]:
+                if v == start:
+                    continue
+
+                if not bits[v]:
+                    stack.append((v, SharedPath(nodes[v], path), visited))
+                elif not visited & bits[v]:
+                    stack.append((v, SharedPath(nodes[v], path), visited | bits[v]))
+
+    def build_traversal_tree(self):
+        return TraversalTree([self.start])
 
     @classmethod
     def from_raw_lines(cls, lines):
@@ -136,10 +296,10 @@ def main():
 
     network = Network.from_raw_lines(lines)
 
-    for path in network.paths:
+    for path in network.iter_paths():
         print([n.name for n in path])
 
-    print(len(network.paths))
+    print(network.count_paths())
 
 
 
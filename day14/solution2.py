@@ -1,6 +1,76 @@
 import re
 
 
+PAIR_TRANSITIONS = {}
+
+
+class PairTransitions:
+    # One polymerisation step as a sparse matrix over pair indices. Row i maps
+    # to {j: n}, meaning every occurrence of pair i becomes n of pair j. Powers
+    # M^(2^k) are squared up when asked for and kept for every template
+    # sharing the same rules.
+    def __init__(self, alphabet, rules):
+        self.pairs = [a + b for a in alphabet for b in alphabet]
+        self.index = {pair: idx for idx, pair in enumerate(self.pairs)}
+
+        step = [{idx: 1} for idx in range(len(self.pairs))]
+
+        for pattern, insert in rules:
+            row = {}
+            for new_pair in (pattern[0] + insert, insert + pattern[1]):
+                new_idx = self.index[new_pair]
+                row[new_idx] = row.get(new_idx, 0) + 1
+
+            step[self.index[pattern]] = row
+
+        self.powers = [step]
+
+    @classmethod
+    def for_rules(cls, rules, template=""):
+        alphabet = sorted(set(template).union(*(pattern + insert for pattern, insert in rules)))
+        key = (tuple(alphabet), tuple(sorted(rules)))
+
+        if key not in PAIR_TRANSITIONS:
+            PAIR_TRANSITIONS[key] = cls(alphabet, rules)
+
+        return PAIR_TRANSITIONS[key]
+
+    def power(self, k):
+        while len(self.powers) <= k:
+            self.powers.append(self.compose(self.powers[-1], self.powers[-1]))
+
+        return self.powers[k]
+
+    def compose(self, a, b):
+        result = []
+
+        for row in a:
+            new_row = {}
+
+            for mid, count in row.items():
+                for dest, mid_count in b[mid].items():
+                    new_row[dest] = new_row.get(dest, 0) + count * mid_count
+
+            result.append(new_row)
+
+        return result
+
+    def apply(self, matrix, vector):
+        result = {}
+
+        for src, count in vector.items():
+            for dest, multiplier in matrix[src].items():
+                result[dest] = result.get(dest, 0) + count * multiplier
+
+        return result
+
+    def to_vector(self, pairs):
+        return {self.index[pair]: count for pair, count in pairs.items() if count}
+
+    def from_vector(self, vector):
+        return {self.pairs[idx]: count for idx, count in vector.items() if count}
+
+
 class Polymerizer:
     def __init__(self, template, rules):
         self.template = template
@@ -35,7 +105,6 @@ class Polymerizer:
         for idx, c1 in enumerate(self.template[:-1]):
             c2 = self.template[idx + 1]
             pair = c1 + c2
-            print(pair)
 
             if pair not in pairs:
                 pairs[pair] = 1
@@ -56,33 +125,51 @@ class Polymerizer:
         return chars
 
     def tick(self):
-        new_pairs = {}
-
-        for pattern, insert in self.rules:
-            new_pair_1 = pattern[0] + insert
-            new_pair_2 = insert + pattern[1]
-            num_matches = self.pairs.get(pattern, 0)
-
-            if new_pair_1 not in new_pairs:
-                new_pairs[new_pair_1] = num_matches
-            else:
-                new_pairs[new_pair_1] += num_matches
-
-            if new_pair_2 not in new_pairs:
-                new_pairs[new_pair_2] = num_matches
+        self.fast_forward(1)
+
+    def fast_forward(self, num_ticks, reuse=False):
+        # Squaring is a dense product over ever larger ints and costs far more
+        # than the steps it saves on a single run, so powers are only built
+        # when the caller says the same rules will be run again. Powers that
+        # already exist are used for their bits of num_ticks, and whatever
+        # is left is stepped one tick at a time.
+        transitions = PairTransitions.for_rules(self.rules, self.template)
+        vector = transitions.to_vector(self.pairs)
+
+        if reuse and num_ticks:
+            transitions.power(num_ticks.bit_length() - 1)
+
+        remaining = 0
+        k = 0
+
+        while num_ticks:
+            if num_ticks & 1:
+                if k < len(transitions.powers):
+                    vector = transitions.apply(transitions.powers[k], vector)
+                else:
+                    remaining += 1 << k
+
+            num_ticks >>= 1
+            k += 1
+
+        for _ in range(remaining):
+            vector = transitions.apply(transitions.powers[0], vector)
+
+        self.pairs = transitions.from_vector(vector)
+        self.chars = self.count_chars()
+
+    def count_chars(self):
+        # Every character is the first half of exactly one pair, apart from the
+        # last one, which never changes
+        chars = {self.template[-1]: 1}
+
+        for pair, count in self.pairs.items():
+            if pair[0] not in chars:
+                chars[pair[0]] = count
             else:
-                new_pairs[new_pair_2] += num_matches
+                chars[pair[0]] += count
 
-            if insert not in self.chars:
-                self.chars[insert] = num_matches
-            else:
-                self.chars[insert] += num_matches
-
-        self.pairs = new_pairs
-
-    def fast_forward(self, num_ticks):
-        for _ in range(num_ticks):
-            self.tick()
+        return chars
 
     @property
     def num_most_common(self):
@@ -110,7 +197,6 @@ def main():
     polymerizer = Polymerizer.from_input(lines)
 
     polymerizer.fast_forward(40)
-    print("--------")
     print(polymerizer.num_most_common)
     print(polymerizer.num_least_common)
     print(polymerizer.num_most_common - polymerizer.num_least_common)
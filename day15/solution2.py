@@ -1,83 +1,115 @@
+import array
+import heapq
+
+
+UNVISITED = 2 ** 62
+
+
+class TiledRisks:
+    # Flat, read-only view of the tiled cave that works out each risk on
+    # demand, so only the original tile is ever held in memory
+    def __init__(self, rows, tiles):
+        self.tile = [val for row in rows for val in row]
+        self.tile_width = len(rows[0])
+        self.tile_height = len(rows)
+        self.width = self.tile_width * tiles
+        self.height = self.tile_height * tiles
+
+    def __len__(self):
+        return self.width * self.height
+
+    def __getitem__(self, idx):
+        y, x = divmod(idx, self.width)
+        i, tile_y = divmod(y, self.tile_height)
+        j, tile_x = divmod(x, self.tile_width)
+        val = self.tile[tile_y * self.tile_width + tile_x]
+
+        return ((val - 1 + j + i) % 9) + 1
+
+
+def tile_risks(rows, tiles):
+    risks = []
+
+    for i in range(tiles):
+        for row in rows:
+            for j in range(tiles):
+                for val in row:
+                    new_val = ((val -1 + j + i) % 9) + 1
+                    risks.append(new_val)
+
+    return risks
+
+
 class Cave:
-    def __init__(self, rows):
-        self.rows = []
-        for i in range(5):
-            for row in rows:
-                new_row = []
-                for j in range(5):
-                    for val in row:
-                        new_val = ((val -1 + j + i) % 9) + 1
-                        new_row.append(new_val)
-                self.rows.append(new_row)
-
-        self.cols = list(map(list, zip(*self.rows)))
-        self.width = len(self.rows[0])
-        self.height = len(self.cols[0])
+    def __init__(self, rows, tiles=5, virtual=False):
+        self.width = len(rows[0]) * tiles
+        self.height = len(rows) * tiles
+
+        if virtual:
+            self.risks = TiledRisks(rows, tiles)
+        else:
+            self.risks = tile_risks(rows, tiles)
 
     @classmethod
-    def from_raw_lines(cls, lines):
+    def from_raw_lines(cls, lines, tiles=5, virtual=False):
         rows = []
 
         for line in lines:
             if line.strip():
                 rows.append([int(c) for c in line])
 
-        return cls(rows)
+        return cls(rows, tiles=tiles, virtual=virtual)
 
-    def search(self):
-        q = {}
-        dist = {}
-        prev = {}
+    def search(self, target=None, heuristic=False):
+        # Dijkstra over the flattened grid, or A* when heuristic is set. Every
+        # step costs at least 1, so the manhattan distance never overestimates.
+        if target is None:
+            target = (self.width - 1, self.height - 1)
 
-        for y, row in enumerate(self.rows):
-            for x, cost in enumerate(row):
-                q[(x, y)] = True
-                dist[(x, y)] = 999999999999999999999
-                prev[(x, y)] = None
+        width = self.width
+        height = self.height
+        risks = self.risks
+        tx, ty = target
+        goal = ty * width + tx
 
-        dist[(0, 0)] = 0
+        dist = array.array("q", [UNVISITED]) * (width * height)
+        dist[0] = 0
 
-        while q:
-            print(len(q))
-
-            u = None
-            min_dist = None
+        start_estimate = tx + ty if heuristic else 0
+        q = [(start_estimate, 0, 0)]
 
-            for k in q.keys():
-                if min_dist is None or dist[k] < min_dist:
-                    min_dist = dist[k]
-                    u = k
-
-            del q[u]
+        while q:
+            _, d, u = heapq.heappop(q)
 
-            neighbours = (
-                (u[0] - 1, u[1]),
-                (u[0] + 1, u[1]),
-                (u[0], u[1] - 1),
-                (u[0], u[1] + 1),
-            )
+            if u == goal:
+                return d
 
-            valid_neighbours = []
+            if d > dist[u]:
+                continue
 
-            for n in neighbours:
-                if n not in q:
-                    continue
+            x = u % width
+            y = u // width
 
-                if not (0 <= n[0] < self.width):
-                    continue
+            neighbours = []
 
-                if not (0 <= n[1] < self.height):
-                    continue
+            if x > 0:
+                neighbours.append((u - 1, x - 1, y))
+            if x < width - 1:
+                neighbours.append((u + 1, x + 1, y))
+            if y > 0:
+                neighbours.append((u - width, x, y - 1))
+            if y < height - 1:
+                neighbours.append((u + width, x, y + 1))
 
-                valid_neighbours.append(n)
+            for v, vx, vy in neighbours:
+                alt = d + risks[v]
 
-            for v in valid_neighbours:
-                alt = dist[u] + self.rows[v[1]][v[0]]
-                if alt <= dist[v]:
+                if alt < dist[v]:
                     dist[v] = alt
-                    prev[v] = u
+                    estimate = alt + abs(tx - vx) + abs(ty - vy) if heuristic else alt
+                    heapq.heappush(q, (estimate, alt, v))
 
-        return dist, prev
+        raise Exception("Target unreachable: %s,%s" % target)
 
 
 def main():
@@ -86,8 +118,7 @@ def main():
 
     cave = Cave.from_raw_lines(lines)
 
-    dist, prev = cave.search()
-    print(dist[(499, 499)])
+    print(cave.search())
 
 
 if __name__ == "__main__":
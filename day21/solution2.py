@@ -87,6 +87,8 @@ class Game:
 
             print(f"After Turn #{current_turn}: P1={p1_total_wins} P2={p2_total_wins}")
 
+        return p1_total_wins, p2_total_wins
+
     @property
     def still_playing(self):
         count = 0
@@ -2,6 +2,11 @@ import math
 import re
 
 
+# Worked out on pen and paper using output of solution_sympy.py
+LARGEST_INPUT = [9, 9, 8, 9, 3, 9, 9, 9, 2, 9, 1, 9, 6, 7]
+SMALLEST_INPUT = [3, 4, 1, 7, 1, 9, 1, 1, 1, 8, 1, 2, 1, 1]
+
+
 class ALU:
     VALID_INPUTS = (1, 2, 3, 4, 5, 6, 7, 8, 9)
 
@@ -130,16 +135,12 @@ def main():
     alu = ALU()
     program = alu.compile(lines)
 
-    # Worked out on pen and paper using output of solution_sympy.py
-    largest_input = [9, 9, 8, 9, 3, 9, 9, 9, 2, 9, 1, 9, 6, 7]
-    smallest_input = [3, 4, 1, 7, 1, 9, 1, 1, 1, 8, 1, 2, 1, 1]
-
-    alu.run(program, largest_input)
+    alu.run(program, LARGEST_INPUT)
     print(alu.z)
 
     alu.reset()
 
-    alu.run(program, smallest_input)
+    alu.run(program, SMALLEST_INPUT)
     print(alu.z)
 
 